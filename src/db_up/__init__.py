@@ -4,8 +4,14 @@ db-up: A simple tool to monitor PostgreSQL database connectivity.
 This package provides a lightweight monitoring solution for PostgreSQL databases,
 checking connectivity at configurable intervals with comprehensive logging and
 security features.
+
+Public names are imported lazily on first access (PEP 562) so that importing
+the package does not pull in psycopg2, PyYAML and friends up front.
 """
 
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
 __version__ = "1.0.0"
 __all__ = [
     "HealthCheckResult",
@@ -15,8 +21,34 @@ __all__ = [
     "setup_logging",
 ]
 
-from db_up.models import HealthCheckResult
-from db_up.db_checker import DatabaseChecker
-from db_up.main import Application
-from db_up.config import load_config
-from db_up.logger import setup_logging
+# Public name -> defining module
+_LAZY_IMPORTS = {
+    "HealthCheckResult": "db_up.models",
+    "DatabaseChecker": "db_up.db_checker",
+    "Application": "db_up.main",
+    "load_config": "db_up.config",
+    "setup_logging": "db_up.logger",
+}
+
+if TYPE_CHECKING:
+    from db_up.models import HealthCheckResult
+    from db_up.db_checker import DatabaseChecker
+    from db_up.main import Application
+    from db_up.config import load_config
+    from db_up.logger import setup_logging
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names on first access and cache them on the module."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """Include lazily imported names in dir() output."""
+    return sorted(set(globals()) | set(__all__))
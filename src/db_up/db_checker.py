@@ -11,15 +11,49 @@ This module provides the core database health check functionality with:
 SECURITY: All database operations use read-only mode and have timeouts.
 """
 
+import re
 import time
-from datetime import datetime
-from typing import Optional, Callable
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional
 import psycopg2
 from psycopg2 import sql
 
 from db_up.models import DatabaseConfig, HealthCheckResult
 from db_up.security import sanitize_error
 
+# Phrases the error classifier looks for, each in its own named group
+_ERROR_TOKENS = {
+    "authentication": r"authentication|password",
+    "permission": r"permission|access denied",
+    "database": r"database",
+    "missing": r"does not exist",
+    "connections": r"too many connections",
+    "timeout": r"timeout|canceling statement",
+}
+
+_ERROR_CLASSIFIER = re.compile(
+    "|".join(f"(?P<{name}>{pattern})" for name, pattern in _ERROR_TOKENS.items()),
+    re.IGNORECASE,
+)
+
+# Error codes in priority order, with the phrases that must all be present
+_ERROR_PATTERNS = (
+    ("AUTHENTICATION_ERROR", frozenset({"authentication"})),
+    ("PERMISSION_ERROR", frozenset({"permission"})),
+    ("DATABASE_NOT_FOUND", frozenset({"database", "missing"})),
+    ("TOO_MANY_CONNECTIONS", frozenset({"connections"})),
+    ("QUERY_TIMEOUT", frozenset({"timeout"})),
+)
+
+# TCP keepalive settings (seconds / probes) for the kept connection
+_KEEPALIVE_IDLE = 30
+_KEEPALIVE_INTERVAL = 10
+_KEEPALIVE_COUNT = 3
+
+# libpq only understands tcp_user_timeout from version 12 on; older
+# client libraries reject every connection that passes it
+_HAS_TCP_USER_TIMEOUT = psycopg2.extensions.libpq_version() >= 120000
+
 
 class DatabaseChecker:
     """
@@ -30,8 +64,9 @@ class DatabaseChecker:
     - Read-only transaction mode
     - Statement timeout
     - Automatic credential sanitization
-    - Guaranteed connection cleanup
+    - Connection is dropped on any error and re-established on the next check
 
+    The connection is kept open between checks; call close() when done.
     The timer can be injected for deterministic testing.
     """
 
@@ -46,25 +81,31 @@ class DatabaseChecker:
 
         Args:
             config: Database configuration
-            timer: Optional timer function for testing (default: time.time)
+            timer: Optional timer function for testing (default: time.monotonic)
             redact_hostnames: If True, redact IP addresses in errors
         """
         self.config = config
-        self.timer = timer or time.time
+        self.timer = timer or time.monotonic
         self.redact_hostnames = redact_hostnames
+        self._conn: Optional[Any] = None
+        self._cursor: Optional[Any] = None
+        self._conn_params = self._build_conn_params()
 
     def check_connection(self) -> HealthCheckResult:
         """
         Perform a database health check.
 
         This method:
-        1. Establishes a connection with timeout
-        2. Sets read-only transaction mode (SECURITY)
-        3. Sets statement timeout (SECURITY)
-        4. Executes health check query
-        5. Verifies result
-        6. Measures response time
-        7. Guarantees connection cleanup
+        1. Reuses the open connection, or establishes one with timeout,
+           read-only transaction mode and statement timeout (SECURITY)
+        2. Executes health check query, retrying once on a fresh connection
+           if the reused one turns out to be broken
+        3. Verifies result
+        4. Measures response time
+        5. Closes the connection on any error so the next check reconnects
+
+        The response time covers connecting only when this check had to
+        connect; on a reused connection it is the query round trip.
 
         Returns:
             HealthCheckResult with status and timing
@@ -76,105 +117,189 @@ class DatabaseChecker:
             >>> if result.is_success():
             ...     print(f"Database is up! Response time: {result.response_time_ms}ms")
         """
+        timestamp = datetime.now(timezone.utc)
         start_time = self.timer()
-        conn = None
-        cursor = None
 
         try:
-            # Establish connection with security settings
-            # Build connection parameters
-            conn_params = {
-                "host": self.config.host,
-                "port": self.config.port,
-                "database": self.config.database,
-                "user": self.config.user,
-                "password": self.config.password,
-                "connect_timeout": self.config.connect_timeout,
-                "sslmode": self.config.ssl_mode,
-                "application_name": self.config.application_name,
-            }
-
-            # Add SSL verification parameter if disabled
-            if not self.config.ssl_verify:
-                # When SSL_VERIFY is false, we need to disable certificate verification
-                # by using sslmode 'require' which requires SSL but doesn't verify cert
-                conn_params["sslmode"] = "require"
-                if self.config.ssl_mode in ["verify-ca", "verify-full"]:
-                    # Override to 'require' to skip verification
-                    conn_params["sslmode"] = "require"
-
-            conn = psycopg2.connect(**conn_params)
-
-            cursor = conn.cursor()
-
-            # SECURITY: Set read-only mode
-            cursor.execute("SET SESSION CHARACTERISTICS AS TRANSACTION READ ONLY")
-
-            # SECURITY: Set statement timeout
-            cursor.execute(
-                sql.SQL("SET statement_timeout = %s"),
-                [f"{self.config.statement_timeout}s"],
-            )
-
-            # Execute health check query
-            # Note: Using simple query, not parameterized, but query is validated
-            cursor.execute("SELECT 1 AS health_check")
-            result = cursor.fetchone()
-
-            # Verify expected result
-            if result is None or result[0] != 1:
-                raise ValueError("Unexpected health check result")
+            self._run_health_query()
 
             elapsed_ms = (self.timer() - start_time) * 1000
 
             return HealthCheckResult(
-                timestamp=datetime.utcnow(),
+                timestamp=timestamp,
                 status="success",
                 response_time_ms=elapsed_ms,
             )
 
         except psycopg2.OperationalError as e:
             # Network/connection errors
+            self.close()
             return self._handle_error(
-                start_time, "CONNECTION_ERROR", self._sanitize_error(str(e))
+                start_time,
+                timestamp,
+                "CONNECTION_ERROR",
+                self._sanitize_error(str(e)),
             )
 
         except psycopg2.DatabaseError as e:
             # Database-specific errors (including authentication)
+            self.close()
             error_code = self._classify_database_error(e)
             return self._handle_error(
-                start_time, error_code, self._sanitize_error(str(e))
+                start_time, timestamp, error_code, self._sanitize_error(str(e))
             )
 
         except Exception:
             # Unexpected errors
+            self.close()
             return self._handle_error(
                 start_time,
+                timestamp,
                 "UNKNOWN_ERROR",
                 "An unexpected error occurred during health check",
             )
 
-        finally:
-            # SECURITY: Guaranteed cleanup even on error
-            if cursor:
-                try:
-                    cursor.close()
-                except Exception:
-                    pass
-            if conn:
+    def _run_health_query(self) -> None:
+        """
+        Run the health check query and verify its result.
+
+        A kept connection can be dropped behind our back (server restart,
+        idle timeout in a pooler or NAT, failover), so a connection-level
+        error on a reused connection is retried once on a new connection
+        instead of being reported as the database being down. A statement
+        timeout is not retried: the connection was fine, the query was slow.
+
+        Raises:
+            psycopg2.Error: If the query fails
+            ValueError: If the query returns an unexpected result
+        """
+        reused = self._conn is not None and not self._conn.closed
+        try:
+            self._query_once()
+        except (psycopg2.OperationalError, psycopg2.InterfaceError) as e:
+            if not reused or isinstance(e, psycopg2.extensions.QueryCanceledError):
+                raise
+            self.close()
+            self._query_once()
+
+    def _query_once(self) -> None:
+        """
+        Run the health check query once on the current or a new connection.
+
+        Raises:
+            psycopg2.Error: If connecting or the query fails
+            ValueError: If the query returns an unexpected result
+        """
+        cursor = self._get_cursor()
+
+        # Execute health check query
+        # Note: Using simple query, not parameterized, but query is validated
+        cursor.execute("SELECT 1 AS health_check")
+        result = cursor.fetchone()
+
+        # Verify expected result
+        if result is None or result[0] != 1:
+            raise ValueError("Unexpected health check result")
+
+    def _build_conn_params(self) -> Dict[str, Any]:
+        """
+        Build psycopg2 connection parameters from the configuration.
+
+        Returns:
+            Keyword arguments for psycopg2.connect()
+        """
+        conn_params: Dict[str, Any] = {
+            "host": self.config.host,
+            "port": self.config.port,
+            "database": self.config.database,
+            "user": self.config.user,
+            "password": self.config.password,
+            "connect_timeout": self.config.connect_timeout,
+            "sslmode": self.config.ssl_mode,
+            "application_name": self.config.application_name,
+            # Detect half-open connections: probe an idle connection and
+            # give up on unacknowledged writes instead of blocking in
+            # execute() until the OS gives up (minutes)
+            "keepalives": 1,
+            "keepalives_idle": _KEEPALIVE_IDLE,
+            "keepalives_interval": _KEEPALIVE_INTERVAL,
+            "keepalives_count": _KEEPALIVE_COUNT,
+        }
+        if _HAS_TCP_USER_TIMEOUT:
+            conn_params["tcp_user_timeout"] = self.config.connect_timeout * 1000
+
+        if not self.config.ssl_verify:
+            # When SSL_VERIFY is false, we need to disable certificate verification
+            # by using sslmode 'require' which requires SSL but doesn't verify cert
+            conn_params["sslmode"] = "require"
+
+        return conn_params
+
+    def _get_cursor(self) -> Any:
+        """
+        Return the cursor of the open connection, connecting if needed.
+
+        A new connection is configured once with autocommit, read-only
+        transactions (SECURITY) and a statement timeout (SECURITY), and its
+        cursor is kept for the lifetime of the connection, so subsequent
+        checks only run the health check query.
+
+        Returns:
+            Open psycopg2 cursor
+        """
+        if self._conn is not None and not self._conn.closed:
+            return self._cursor
+
+        self._conn = psycopg2.connect(**self._conn_params)
+
+        try:
+            # Each health check runs as its own statement, no open transaction
+            self._conn.autocommit = True
+
+            self._cursor = self._conn.cursor()
+
+            # SECURITY: Set read-only mode
+            self._cursor.execute("SET SESSION CHARACTERISTICS AS TRANSACTION READ ONLY")
+
+            # SECURITY: Set statement timeout
+            self._cursor.execute(
+                sql.SQL("SET statement_timeout = %s"),
+                [f"{self.config.statement_timeout}s"],
+            )
+        except Exception:
+            self.close()
+            raise
+
+        return self._cursor
+
+    def close(self) -> None:
+        """
+        Close the persistent cursor and database connection, if any.
+
+        SECURITY: Safe to call repeatedly; errors during close are ignored.
+        """
+        cursor, self._cursor = self._cursor, None
+        conn, self._conn = self._conn, None
+        for resource in (cursor, conn):
+            if resource is not None:
                 try:
-                    conn.close()
+                    resource.close()
                 except Exception:
                     pass
 
     def _handle_error(
-        self, start_time: float, error_code: str, error_message: str
+        self,
+        start_time: float,
+        timestamp: datetime,
+        error_code: str,
+        error_message: str,
     ) -> HealthCheckResult:
         """
         Create error result with sanitized message.
 
         Args:
-            start_time: Start time of the check
+            start_time: Start time of the check (timer value)
+            timestamp: Wall-clock time the check started (UTC)
             error_code: Error code
             error_message: Error message (already sanitized)
 
@@ -183,7 +308,7 @@ class DatabaseChecker:
         """
         elapsed_ms = (self.timer() - start_time) * 1000
         return HealthCheckResult(
-            timestamp=datetime.utcnow(),
+            timestamp=timestamp,
             status="failure",
             response_time_ms=elapsed_ms,
             error_code=error_code,
@@ -212,27 +337,11 @@ class DatabaseChecker:
         Returns:
             Error code string
         """
-        error_str = str(error).lower()
-
-        # Authentication errors
-        if "authentication" in error_str or "password" in error_str:
-            return "AUTHENTICATION_ERROR"
-
-        # Permission errors
-        if "permission" in error_str or "access denied" in error_str:
-            return "PERMISSION_ERROR"
-
-        # Database not found
-        if "database" in error_str and "does not exist" in error_str:
-            return "DATABASE_NOT_FOUND"
-
-        # Connection pool exhausted
-        if "too many connections" in error_str:
-            return "TOO_MANY_CONNECTIONS"
-
-        # Query timeout
-        if "timeout" in error_str or "canceling statement" in error_str:
-            return "QUERY_TIMEOUT"
+        # One scan collects every phrase present; report the highest priority
+        found = {match.lastgroup for match in _ERROR_CLASSIFIER.finditer(str(error))}
+        for error_code, tokens in _ERROR_PATTERNS:
+            if tokens <= found:
+                return error_code
 
         # Generic database error
         return "DATABASE_ERROR"
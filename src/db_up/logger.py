@@ -15,10 +15,56 @@ import logging
 import json
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Optional, Tuple
 
 from db_up.models import LoggingConfig
-from db_up.security import sanitize_error
+from db_up.security import has_host_marker, has_sensitive_marker, sanitize_error
+
+# orjson is optional; it serializes log records several times faster
+try:
+    import orjson
+
+    def _json_dumps(data: Dict[str, Any]) -> str:
+        """Serialize a log record dict to a JSON string using orjson."""
+        return orjson.dumps(data).decode("utf-8")
+
+except ImportError:  # pragma: no cover
+
+    def _json_dumps(data: Dict[str, Any]) -> str:
+        """Serialize a log record dict to a JSON string using json."""
+        return json.dumps(data)
+
+
+# Extra record attributes copied into JSON output when present
+_EXTRA_FIELDS = (
+    "response_time_ms",
+    "status",
+    "error_code",
+    "error_message",
+    "retry_attempt",
+    "max_retries",
+    "check_number",
+)
+
+# Record attribute holding (formatter, JSON string) from JSONFormatter.format
+_JSON_CACHE_ATTR = "_db_up_json"
+
+_LEVEL_MAP = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+# ANSI reset sequence for colored console output
+_RESET = "\033[0m"
+
+_TEXT_FORMAT = "%(asctime)s [%(levelname)s] %(message)s"
+_TEXT_DATEFMT = "%Y-%m-%d %H:%M:%S"
+
+# Record argument types whose text SensitiveDataFilter redacts
+_TEXT_ARG_TYPES = (str, BaseException)
 
 
 class SensitiveDataFilter(logging.Filter):
@@ -50,23 +96,102 @@ class SensitiveDataFilter(logging.Filter):
             True (always allow the record, just modify it)
         """
         # Sanitize the message
-        if hasattr(record, "msg") and isinstance(record.msg, str):
+        if isinstance(record.msg, str) and self._may_be_sensitive(record.msg):
             record.msg = sanitize_error(record.msg, self.redact_hostnames)
 
-        # Sanitize any string arguments
-        if hasattr(record, "args") and record.args:
-            sanitized_args: List[Any] = []
-            for arg in record.args:
-                if isinstance(arg, str):
-                    sanitized_args.append(sanitize_error(arg, self.redact_hostnames))
-                else:
-                    sanitized_args.append(arg)
-            record.args = tuple(sanitized_args)
+        # Sanitize any string or exception arguments; others are left untouched
+        args = record.args
+        if args and isinstance(args, tuple):
+            record.args = self._sanitize_args(args)
 
         return True
 
+    def _sanitize_args(self, args: Tuple[Any, ...]) -> Tuple[Any, ...]:
+        """
+        Redact sensitive data from %-style message arguments.
+
+        Exceptions are logged through their message text, which may hold
+        connection details, so a sensitive one is replaced by its
+        sanitized message.
+
+        Args:
+            args: Record arguments
+
+        Returns:
+            args itself if nothing needs redacting, otherwise a new tuple
+        """
+        if not any(
+            isinstance(arg, _TEXT_ARG_TYPES) and self._may_be_sensitive(str(arg))
+            for arg in args
+        ):
+            return args
+        return tuple(
+            (
+                sanitize_error(str(arg), self.redact_hostnames)
+                if isinstance(arg, _TEXT_ARG_TYPES)
+                else arg
+            )
+            for arg in args
+        )
+
+    def _may_be_sensitive(self, text: str) -> bool:
+        """
+        Cheap pre-check for whether text needs the regex-based sanitizer.
+
+        Args:
+            text: Message or argument text
+
+        Returns:
+            False only if sanitize_error() could not change the text
+        """
+        return has_sensitive_marker(text) or (
+            self.redact_hostnames and has_host_marker(text)
+        )
+
+
+class _TimeCachingFormatter(logging.Formatter):
+    """
+    Formatter that reuses the formatted timestamp within a second.
+
+    Records arriving in the same second share one strftime() result.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the formatter with an empty timestamp cache."""
+        super().__init__(*args, **kwargs)
+        # (whole second, datefmt, formatted string) of the last timestamp
+        self._time_cache: Tuple[int, Optional[str], str] = (-1, None, "")
+
+    def formatTime(
+        self, record: logging.LogRecord, datefmt: Optional[str] = None
+    ) -> str:
+        """
+        Format the record time, reusing the result within the same second.
 
-class JSONFormatter(logging.Formatter):
+        Only applies when datefmt is set; the default format includes
+        milliseconds and is delegated to the base class.
+
+        Args:
+            record: Log record to format
+            datefmt: strftime format string
+
+        Returns:
+            Formatted timestamp
+        """
+        if datefmt is None:
+            return super().formatTime(record, datefmt)
+
+        second = int(record.created)
+        cached_second, cached_datefmt, cached_value = self._time_cache
+        if second == cached_second and datefmt == cached_datefmt:
+            return cached_value
+
+        value = super().formatTime(record, datefmt)
+        self._time_cache = (second, datefmt, value)
+        return value
+
+
+class JSONFormatter(_TimeCachingFormatter):
     """
     Format logs as JSON for structured logging.
 
@@ -78,12 +203,22 @@ class JSONFormatter(logging.Formatter):
         """
         Format log record as JSON.
 
+        The result is stored on the record (as the base class does with
+        exc_text), so handlers sharing this formatter, e.g. console and
+        file with output "both", serialize each record only once.
+
         Args:
             record: Log record to format
 
         Returns:
             JSON string
         """
+        record_dict = record.__dict__
+        cached = record_dict.get(_JSON_CACHE_ATTR)
+        if cached is not None and cached[0] is self:
+            cached_json: str = cached[1]
+            return cached_json
+
         log_data: Dict[str, Any] = {
             "timestamp": self.formatTime(record, self.datefmt),
             "level": record.levelname,
@@ -93,28 +228,20 @@ class JSONFormatter(logging.Formatter):
         }
 
         # Add extra fields if present
-        extra_fields = [
-            "response_time_ms",
-            "status",
-            "error_code",
-            "error_message",
-            "retry_attempt",
-            "max_retries",
-            "check_number",
-        ]
-
-        for field in extra_fields:
-            if hasattr(record, field):
-                log_data[field] = getattr(record, field)
+        log_data.update(
+            {key: record_dict[key] for key in _EXTRA_FIELDS if key in record_dict}
+        )
 
         # Add exception info if present
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
 
-        return json.dumps(log_data)
+        result = _json_dumps(log_data)
+        record_dict[_JSON_CACHE_ATTR] = (self, result)
+        return result
 
 
-class ColoredFormatter(logging.Formatter):
+class ColoredFormatter(_TimeCachingFormatter):
     """
     Format logs with colors for console output.
 
@@ -127,7 +254,14 @@ class ColoredFormatter(logging.Formatter):
         "INFO": "\033[32m",  # Green
         "WARNING": "\033[33m",  # Yellow
         "ERROR": "\033[31m",  # Red
-        "RESET": "\033[0m",  # Reset
+        "RESET": _RESET,  # Reset
+    }
+
+    # Fully colored level names, built once
+    COLORED_LEVELNAMES = {
+        level: f"{code}{level}{_RESET}"
+        for level, code in COLORS.items()
+        if level != "RESET"
     }
 
     def format(self, record: logging.LogRecord) -> str:
@@ -140,21 +274,42 @@ class ColoredFormatter(logging.Formatter):
         Returns:
             Colored log string
         """
-        # Add color to level name
+        # Add color to level name, restoring the original afterwards
         levelname = record.levelname
-        if levelname in self.COLORS:
-            colored_levelname = (
-                f"{self.COLORS[levelname]}{levelname}{self.COLORS['RESET']}"
-            )
-            record.levelname = colored_levelname
+        record.levelname = self.COLORED_LEVELNAMES.get(levelname, levelname)
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
 
-        # Format the record
-        result = super().format(record)
 
-        # Restore original levelname
-        record.levelname = levelname
+# The package logger; logging.getLogger() always returns this same object
+_LOGGER = logging.getLogger("db-up")
 
-        return result
+# One instance of each formatter is shared by all handlers; their only state
+# is the per-second timestamp cache, which is the same for every handler
+_JSON_FORMATTER = JSONFormatter(datefmt="%Y-%m-%dT%H:%M:%S")
+_COLORED_FORMATTER = ColoredFormatter(_TEXT_FORMAT, datefmt=_TEXT_DATEFMT)
+_FILE_FORMATTER = _TimeCachingFormatter(_TEXT_FORMAT, datefmt=_TEXT_DATEFMT)
+
+
+def _resolve_level(name: str) -> int:
+    """
+    Convert a log level name to its numeric value.
+
+    Args:
+        name: Level name (case-insensitive), e.g. "INFO"
+
+    Returns:
+        Numeric logging level
+
+    Raises:
+        ValueError: If the level name is unknown
+    """
+    try:
+        return _LEVEL_MAP[name.upper()]
+    except KeyError:
+        raise ValueError(f"Unknown log level: {name}") from None
 
 
 def setup_logging(config: LoggingConfig) -> logging.Logger:
@@ -175,40 +330,49 @@ def setup_logging(config: LoggingConfig) -> logging.Logger:
     Returns:
         Configured logger instance
 
+    Raises:
+        ValueError: If config.level is not a known log level
+
     Example:
         >>> from db_up.models import LoggingConfig
         >>> config = LoggingConfig(level='DEBUG', output='console')
         >>> logger = setup_logging(config)
         >>> logger.info("Database connection successful")
     """
-    # Get or create logger
-    logger = logging.getLogger("db-up")
-    logger.setLevel(getattr(logging, config.level))
+    logger = _LOGGER
+    level = _resolve_level(config.level)
+    logger.setLevel(level)
 
-    # Clear existing handlers to avoid duplicates
+    # Close and clear existing handlers to avoid duplicates and leaked files
+    for handler in logger.handlers:
+        handler.close()
     logger.handlers.clear()
 
     # Prevent propagation to root logger
     logger.propagate = False
 
-    # Add sensitive data filter (SECURITY)
+    # Sensitive data filter (SECURITY), attached to each handler below.
+    # Handler filters also see records propagated from child loggers and
+    # only run for records that pass the handler level.
+    sensitive_filter: Optional[SensitiveDataFilter] = None
     if config.redact_credentials:
-        logger.addFilter(SensitiveDataFilter(config.redact_hostnames))
+        sensitive_filter = SensitiveDataFilter(config.redact_hostnames)
 
     # Choose formatter based on format setting
     formatter: logging.Formatter
     if config.format == "json":
-        formatter = JSONFormatter(datefmt="%Y-%m-%dT%H:%M:%S")
+        formatter = _JSON_FORMATTER
     else:
         # Text format with colors for console
-        formatter = ColoredFormatter(
-            "%(asctime)s [%(levelname)s] %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
-        )
+        formatter = _COLORED_FORMATTER
 
     # Add console handler if needed
     if config.output in ("console", "both"):
         console_handler = logging.StreamHandler()
+        console_handler.setLevel(level)
         console_handler.setFormatter(formatter)
+        if sensitive_filter:
+            console_handler.addFilter(sensitive_filter)
         logger.addHandler(console_handler)
 
     # Add file handler if needed
@@ -217,12 +381,13 @@ def setup_logging(config: LoggingConfig) -> logging.Logger:
         log_path = Path(config.file_path)
         log_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Use rotating file handler
+        # Use rotating file handler (opened on first record)
         file_handler = RotatingFileHandler(
             config.file_path,
             maxBytes=config.max_file_size,
             backupCount=config.backup_count,
             encoding="utf-8",
+            delay=True,
         )
 
         # Use JSON formatter for file output (better for parsing)
@@ -230,11 +395,11 @@ def setup_logging(config: LoggingConfig) -> logging.Logger:
             file_handler.setFormatter(formatter)
         else:
             # Use plain text formatter for file
-            file_formatter = logging.Formatter(
-                "%(asctime)s [%(levelname)s] %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
-            )
-            file_handler.setFormatter(file_formatter)
+            file_handler.setFormatter(_FILE_FORMATTER)
 
+        file_handler.setLevel(level)
+        if sensitive_filter:
+            file_handler.addFilter(sensitive_filter)
         logger.addHandler(file_handler)
 
     return logger
@@ -250,4 +415,4 @@ def get_logger() -> logging.Logger:
     Note:
         You must call setup_logging() before using this function.
     """
-    return logging.getLogger("db-up")
+    return _LOGGER
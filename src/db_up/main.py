@@ -6,15 +6,28 @@ This module provides the main application loop and CLI interface.
 
 import sys
 import signal
+import logging
 import time
 import argparse
-from typing import Any, Optional
+import contextlib
+import selectors
+import socket
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional, Set, Tuple
 
-from db_up.config import load_config
 from db_up.logger import setup_logging
-from db_up.db_checker import DatabaseChecker
-from db_up.models import Config
-from db_up.metrics import MetricsCollector
+
+# config, db_checker and metrics pull in yaml, psycopg2 and prometheus_client;
+# they're imported where used so --help and --version start quickly
+if TYPE_CHECKING:
+    from db_up.metrics import MetricsCollector
+    from db_up.models import Config, HealthCheckResult
+
+# Separator line framing startup warnings about metrics
+_BANNER = "=" * 60
+
+# Signals that trigger a graceful shutdown
+_SHUTDOWN_SIGNALS = frozenset({signal.SIGINT, signal.SIGTERM})
 
 
 class Application:
@@ -28,7 +41,7 @@ class Application:
     - Graceful shutdown
     """
 
-    def __init__(self, config: Config):
+    def __init__(self, config: "Config"):
         """
         Initialize the application.
 
@@ -36,17 +49,45 @@ class Application:
             config: Application configuration
         """
         self.config = config
-        self.running = False
+        # Set while the monitor loop is stopped; waiting on it between checks
+        # lets a shutdown signal end the wait immediately
+        self._stop = threading.Event()
+        self._stop.set()
+        self._signal_waiter: Optional[threading.Thread] = None
+        self._saved_sigmask: Set[Any] = set()
+        self._wakeup_selector: Optional[selectors.BaseSelector] = None
+        self._wakeup_sockets: Tuple[socket.socket, ...] = ()
+        self._saved_wakeup_fd = -1
+        from db_up.db_checker import DatabaseChecker
+
         self.logger = setup_logging(config.logging)
         self.checker = DatabaseChecker(
             config.database, redact_hostnames=config.logging.redact_hostnames
         )
         self.check_count = 0
 
+        # extra= dicts for the per-check log records, updated in place each
+        # check. Safe because logging copies extra into the LogRecord when
+        # it's created, before any handler (or queue) sees it.
+        self._success_extra: Dict[str, Any] = {
+            "response_time_ms": 0.0,
+            "status": "success",
+            "check_number": 0,
+        }
+        self._failure_extra: Dict[str, Any] = {
+            "response_time_ms": 0.0,
+            "status": "failure",
+            "error_code": None,
+            "error_message": None,
+            "check_number": 0,
+        }
+
         # Initialize metrics collector if enabled
-        self.metrics: Optional[MetricsCollector] = None
+        self.metrics: Optional["MetricsCollector"] = None
         if config.metrics.enabled:
-            self.metrics = MetricsCollector(
+            from db_up import metrics
+
+            self.metrics = metrics.MetricsCollector(
                 database=config.database.database,
                 host=config.database.host,
                 port=config.metrics.port,
@@ -55,23 +96,32 @@ class Application:
             )
             if not self.metrics._prometheus_available:
                 self.logger.warning(
-                    "=" * 60 + "\n"
+                    "%s\n"
                     "METRICS DISABLED: prometheus-client not installed.\n"
                     "Install with: pip install prometheus-client\n"
                     "Or: pip install db-up[metrics]\n"
-                    + "=" * 60
+                    "%s",
+                    _BANNER,
+                    _BANNER,
                 )
                 self.metrics = None
             else:
                 try:
-                    self.metrics.start_server()
+                    # The server thread inherits the blocked mask, so it never
+                    # takes shutdown signals away from the signal waiter
+                    with _shutdown_signals_blocked():
+                        self.metrics.start_server()
                 except Exception as e:
                     self.logger.error(
-                        "=" * 60 + "\n"
-                        f"METRICS SERVER FAILED TO START: {e}\n"
-                        f"Check if port {config.metrics.port} is available.\n"
+                        "%s\n"
+                        "METRICS SERVER FAILED TO START: %s\n"
+                        "Check if port %s is available.\n"
                         "Metrics collection will be disabled for this session.\n"
-                        + "=" * 60
+                        "%s",
+                        _BANNER,
+                        e,
+                        config.metrics.port,
+                        _BANNER,
                     )
                     self.metrics = None
 
@@ -79,6 +129,19 @@ class Application:
         signal.signal(signal.SIGINT, self._signal_handler)
         signal.signal(signal.SIGTERM, self._signal_handler)
 
+    @property
+    def running(self) -> bool:
+        """Whether the monitor loop is running (not asked to stop)."""
+        return not self._stop.is_set()
+
+    @running.setter
+    def running(self, value: bool) -> None:
+        """Start or stop the monitor loop."""
+        if value:
+            self._stop.clear()
+        else:
+            self._stop.set()
+
     def _signal_handler(self, signum: int, frame: Any) -> None:
         """
         Handle shutdown signals.
@@ -88,7 +151,7 @@ class Application:
             frame: Current stack frame
         """
         signal_name = signal.Signals(signum).name
-        self.logger.info(f"Received {signal_name}, shutting down gracefully...")
+        self.logger.info("Received %s, shutting down gracefully...", signal_name)
         self.running = False
 
     def run_once(self) -> int:
@@ -103,18 +166,24 @@ class Application:
         self.logger.info("Running single health check...")
 
         result = self.checker.check_connection()
+        self.checker.close()
 
         # Record metrics if enabled
         if self.metrics:
             self.metrics.record_check(result)
 
         if result.is_success():
-            ms = result.response_time_ms
-            self.logger.info(f"✓ Health check passed - Response time: {ms:.0f}ms")
+            self.logger.info(
+                "✓ Health check passed - Response time: %.0fms",
+                result.response_time_ms,
+            )
             return 0
         else:
-            err = f"{result.error_code}: {result.error_message}"
-            self.logger.error(f"✗ Health check failed - {err}")
+            self.logger.error(
+                "✗ Health check failed - %s: %s",
+                result.error_code,
+                result.error_message,
+            )
             return 1
 
     def run(self) -> None:
@@ -126,11 +195,19 @@ class Application:
         """
         self.running = True
         db = self.config.database
+        interval = self.config.monitor.check_interval
+        metrics = self.metrics
         self.logger.info(
-            f"Starting db-up monitor - Database: {db.database}@{db.host}:{db.port}, "
-            f"Check interval: {self.config.monitor.check_interval}s"
+            "Starting db-up monitor - Database: %s@%s:%s, Check interval: %ss",
+            db.database,
+            db.host,
+            db.port,
+            interval,
         )
 
+        self._start_signal_waiter()
+
+        next_check = time.monotonic()
         while self.running:
             self.check_count += 1
 
@@ -138,53 +215,199 @@ class Application:
                 result = self.checker.check_connection()
 
                 # Record metrics if enabled
-                if self.metrics:
-                    self.metrics.record_check(result)
-
-                if result.is_success():
-                    response_ms = result.response_time_ms
-                    msg = f"Health check passed - Response time: {response_ms:.0f}ms"
-                    self.logger.info(
-                        msg,
-                        extra={
-                            "response_time_ms": result.response_time_ms,
-                            "status": "success",
-                            "check_number": self.check_count,
-                        },
-                    )
-                else:
-                    err = f"{result.error_code}: {result.error_message}"
-                    msg = f"Health check failed - {err}"
-                    self.logger.warning(
-                        msg,
-                        extra={
-                            "response_time_ms": result.response_time_ms,
-                            "status": "failure",
-                            "error_code": result.error_code,
-                            "error_message": result.error_message,
-                            "check_number": self.check_count,
-                        },
-                    )
+                if metrics:
+                    metrics.record_check(result)
+
+                self._log_result(result)
 
             except Exception as e:
                 self.logger.error(
-                    f"Unexpected error during health check: {e}", exc_info=True
+                    "Unexpected error during health check: %s", e, exc_info=True
                 )
 
-            # Wait for next check (if still running)
-            if self.running:
-                time.sleep(self.config.monitor.check_interval)
+            # Wait for next check; returns early if a signal stops the loop.
+            # Deadlines are fixed so slow checks don't stretch the period.
+            now = time.monotonic()
+            next_check = _next_deadline(next_check, interval, now)
+            self._wait(next_check - now)
 
+        self.logger.info("Shutting down after %d health checks", self.check_count)
         self._shutdown()
-        self.logger.info(f"Shutting down after {self.check_count} health checks")
+
+    def _log_result(self, result: "HealthCheckResult") -> None:
+        """
+        Log the outcome of a health check from the monitor loop.
+
+        Success is logged at INFO and failure at WARNING through a single
+        logger.log() call. The message uses %-style args so it's only
+        formatted when a handler accepts the record, and nothing is built
+        when the level is disabled.
+
+        Args:
+            result: Health check result to log
+        """
+        success = result.is_success()
+        level = logging.INFO if success else logging.WARNING
+        if not self.logger.isEnabledFor(level):
+            return
+
+        args: Tuple[Any, ...]
+        if success:
+            msg = "Health check passed - Response time: %.0fms"
+            args = (result.response_time_ms,)
+            extra = self._success_extra
+        else:
+            msg = "Health check failed - %s: %s"
+            args = (result.error_code, result.error_message)
+            extra = self._failure_extra
+            extra["error_code"] = result.error_code
+            extra["error_message"] = result.error_message
+
+        extra["response_time_ms"] = result.response_time_ms
+        extra["check_number"] = self.check_count
+        self.logger.log(level, msg, *args, extra=extra)
+
+    def _start_signal_waiter(self) -> None:
+        """
+        Collect shutdown signals on a dedicated thread while run() loops.
+
+        SIGINT and SIGTERM are blocked in the main thread and received with
+        sigwait() instead, so they never interrupt a health check or a lock
+        held by the main thread. Where pthread_sigmask isn't available
+        (Windows) the handlers installed in __init__ are used, with a wakeup
+        socket so they can end the wait between checks. If run() isn't
+        called from the main thread, only the handlers are used.
+        """
+        if threading.current_thread() is not threading.main_thread():
+            return
+        if not hasattr(signal, "pthread_sigmask"):
+            self._start_wakeup_selector()
+            return
+
+        self._saved_sigmask = signal.pthread_sigmask(
+            signal.SIG_BLOCK, _SHUTDOWN_SIGNALS
+        )
+        self._signal_waiter = threading.Thread(
+            target=self._wait_for_signal, name="db-up-signals", daemon=True
+        )
+        self._signal_waiter.start()
+
+    def _wait_for_signal(self) -> None:
+        """Block until a shutdown signal arrives, then stop the loop."""
+        signum = signal.sigwait(_SHUTDOWN_SIGNALS)
+        # The loop has already finished if we were woken by _stop_signal_waiter
+        if self.running:
+            self._signal_handler(signum, None)
+
+    def _start_wakeup_selector(self) -> None:
+        """
+        Wake the wait between checks through signal.set_wakeup_fd().
+
+        Without sigwait() the main thread waits itself, and on Windows a
+        blocked Event.wait() isn't interrupted by Ctrl-C. Signals write a
+        byte to the wakeup socket instead, which ends a select() on it.
+        """
+        reader, writer = socket.socketpair()
+        reader.setblocking(False)
+        writer.setblocking(False)
+        self._saved_wakeup_fd = signal.set_wakeup_fd(writer.fileno())
+        self._wakeup_sockets = (reader, writer)
+        self._wakeup_selector = selectors.DefaultSelector()
+        self._wakeup_selector.register(reader, selectors.EVENT_READ)
+
+    def _wait(self, timeout: float) -> None:
+        """
+        Wait until the next check is due or the loop is stopped.
+
+        Args:
+            timeout: Seconds until the next check
+        """
+        if self._wakeup_selector is None:
+            self._stop.wait(timeout)
+            return
+
+        if self._wakeup_selector.select(timeout):
+            # Drain the wakeup bytes; the signal handler has stopped the loop
+            try:
+                self._wakeup_sockets[0].recv(4096)
+            except OSError:  # pragma: no cover
+                pass
+
+    def _stop_signal_waiter(self) -> None:
+        """Stop collecting signals and restore the previous signal state."""
+        if self._wakeup_selector is not None:
+            signal.set_wakeup_fd(self._saved_wakeup_fd)
+            self._wakeup_selector.close()
+            for sock in self._wakeup_sockets:
+                sock.close()
+            self._wakeup_selector = None
+            self._wakeup_sockets = ()
+
+        waiter = self._signal_waiter
+        if waiter is None:
+            return
+
+        if waiter.is_alive() and waiter.ident is not None:
+            try:
+                signal.pthread_kill(waiter.ident, signal.SIGTERM)
+            except OSError:  # pragma: no cover
+                pass  # Exited between the check and the kill
+        waiter.join(timeout=1.0)
+        signal.pthread_sigmask(signal.SIG_SETMASK, self._saved_sigmask)
+        self._signal_waiter = None
+        self._saved_sigmask = set()
 
     def _shutdown(self) -> None:
         """Clean up resources during shutdown."""
+        self._stop_signal_waiter()
+        self.checker.close()
+
         if self.metrics:
             try:
                 self.metrics.shutdown()
             except Exception as e:
-                self.logger.warning(f"Error shutting down metrics server: {e}")
+                self.logger.warning("Error shutting down metrics server: %s", e)
+
+
+@contextlib.contextmanager
+def _shutdown_signals_blocked() -> Iterator[None]:
+    """
+    Block SIGINT and SIGTERM in the current thread for the duration.
+
+    Threads started inside the block inherit the blocked mask. Does
+    nothing where pthread_sigmask isn't available.
+    """
+    if not hasattr(signal, "pthread_sigmask"):
+        yield
+        return
+
+    saved = signal.pthread_sigmask(signal.SIG_BLOCK, _SHUTDOWN_SIGNALS)
+    try:
+        yield
+    finally:
+        signal.pthread_sigmask(signal.SIG_SETMASK, saved)
+
+
+def _next_deadline(previous: float, interval: float, now: float) -> float:
+    """
+    Compute when the next health check is due.
+
+    Checks run on a fixed cadence of interval seconds from the first
+    check. If a check overran, the missed ticks are skipped rather than
+    run back to back.
+
+    Args:
+        previous: Monotonic time the previous check was due
+        interval: Seconds between checks
+        now: Current monotonic time
+
+    Returns:
+        Monotonic time the next check is due (always after now)
+    """
+    deadline = previous + interval
+    if deadline <= now:
+        deadline += ((now - deadline) // interval + 1) * interval
+    return deadline
 
 
 def parse_args() -> argparse.Namespace:
@@ -241,6 +464,8 @@ def main() -> int:
         args = parse_args()
 
         # Load configuration
+        from db_up.config import load_config
+
         try:
             config = load_config(args.config)
         except Exception as e:
@@ -17,19 +17,54 @@ Server Lifecycle:
         finally:
             collector.shutdown()
 
-    Note: The prometheus_client library uses a shared registry. If you create
-    multiple MetricsCollector instances with the same metric names, you may
-    encounter "Duplicated timeseries" errors. Use a single collector per
-    application.
+    Note: Each MetricsCollector registers its metrics in its own
+    CollectorRegistry (which also exposes the standard process, platform and
+    GC metrics), so several collectors can coexist and a collector can be
+    recreated without "Duplicated timeseries" errors.
 """
 
+import functools
 import logging
-from typing import Any, Optional, Tuple
+from typing import Any, Callable, Optional, Tuple
+
+from db_up.models import DEFAULT_HISTOGRAM_BUCKETS, ERROR_CODES, HealthCheckResult
+
+# prometheus-client is optional; without it metrics collection is disabled
+try:
+    from prometheus_client import (
+        GC_COLLECTOR,
+        PLATFORM_COLLECTOR,
+        PROCESS_COLLECTOR,
+        CollectorRegistry,
+        Counter,
+        Gauge,
+        Histogram,
+        start_http_server,
+    )
 
-from db_up.models import HealthCheckResult
+    _PROMETHEUS_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    _PROMETHEUS_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# error_code label value for codes outside ERROR_CODES, so an unexpected
+# code can never add unbounded series to db_up_errors_total
+OTHER_ERROR_CODE = "OTHER"
+
+
+def _new_registry() -> "CollectorRegistry":
+    """
+    Create a registry with the same default collectors as the global one.
+
+    Returns:
+        Registry exposing process, platform and GC metrics
+    """
+    registry = CollectorRegistry()
+    for collector in (PROCESS_COLLECTOR, PLATFORM_COLLECTOR, GC_COLLECTOR):
+        registry.register(collector)
+    return registry
+
 
 class MetricsCollector:
     """
@@ -39,15 +74,14 @@ class MetricsCollector:
     - db_up_connection_status: Gauge for current connection status (1=up, 0=down)
     - db_up_check_duration_seconds: Histogram of health check durations
     - db_up_checks_total: Counter of total checks by status
-    - db_up_errors_total: Counter of errors by error code
+    - db_up_errors_total: Counter of errors by error code (codes outside
+      ERROR_CODES are counted as "OTHER")
 
     All metrics include labels: database, host
     """
 
     # Default histogram buckets (includes 5.0s to match connection timeout)
-    DEFAULT_BUCKETS: Tuple[float, ...] = (
-        0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0
-    )
+    DEFAULT_BUCKETS: Tuple[float, ...] = DEFAULT_HISTOGRAM_BUCKETS
 
     def __init__(
         self,
@@ -56,6 +90,7 @@ class MetricsCollector:
         port: int,
         metrics_host: str = "0.0.0.0",
         histogram_buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+        registry: Optional["CollectorRegistry"] = None,
     ) -> None:
         """
         Initialize the metrics collector.
@@ -66,6 +101,8 @@ class MetricsCollector:
             port: Port for metrics HTTP server
             metrics_host: Host to bind metrics server (default: 0.0.0.0)
             histogram_buckets: Histogram buckets for response time metrics
+            registry: Registry to register metrics in (default: a new
+                registry owned by this collector)
         """
         self.database = database
         self.host = host
@@ -74,57 +111,103 @@ class MetricsCollector:
         self.histogram_buckets = histogram_buckets
         self._server_started = False
         self._server: Optional[Any] = None  # HTTP server instance for cleanup
+        self._registry: Optional["CollectorRegistry"] = None
 
-        try:
-            from prometheus_client import Counter, Gauge, Histogram, start_http_server
-
-            self._start_http_server = start_http_server
-            self._prometheus_available = True
+        self._prometheus_available = _PROMETHEUS_AVAILABLE
 
-            # Create metrics with labels
-            self._connection_status = Gauge(
-                "db_up_connection_status",
-                "Current database connection status (1=up, 0=down)",
-                ["database", "host"],
-            )
-
-            self._check_duration = Histogram(
-                "db_up_check_duration_seconds",
-                "Duration of health checks in seconds",
-                ["database", "host"],
-                buckets=histogram_buckets,
+        if not self._prometheus_available:
+            logger.warning(
+                "prometheus-client not installed. Metrics collection disabled. "
+                "Install with: pip install prometheus-client"
             )
+            # Nothing to record, so skip even the availability check per call
+            self.record_check = self._record_nothing  # type: ignore[method-assign]
+            return
 
-            self._checks_total = Counter(
-                "db_up_checks_total",
-                "Total number of health checks",
-                ["database", "host", "status"],
-            )
+        self._registry = registry if registry is not None else _new_registry()
+
+        # Create metrics with labels
+        self._connection_status = Gauge(
+            "db_up_connection_status",
+            "Current database connection status (1=up, 0=down)",
+            ["database", "host"],
+            registry=self._registry,
+        )
+
+        self._check_duration = Histogram(
+            "db_up_check_duration_seconds",
+            "Duration of health checks in seconds (the query round trip on a "
+            "kept connection; includes connecting only when a check connects)",
+            ["database", "host"],
+            buckets=histogram_buckets,
+            registry=self._registry,
+        )
+
+        self._checks_total = Counter(
+            "db_up_checks_total",
+            "Total number of health checks",
+            ["database", "host", "status"],
+            registry=self._registry,
+        )
+
+        self._errors_total = Counter(
+            "db_up_errors_total",
+            "Total number of errors by error code",
+            ["database", "host", "error_code"],
+            registry=self._registry,
+        )
+
+        self._bind_children()
+
+        logger.info(
+            "Metrics collector initialized for %s@%s "
+            "(metrics server will be on %s:%s)",
+            database,
+            host,
+            metrics_host,
+            port,
+        )
+
+    def _bind_children(self) -> None:
+        """
+        Bind the labelled metric children for this collector.
 
-            self._errors_total = Counter(
-                "db_up_errors_total",
-                "Total number of errors by error code",
-                ["database", "host", "error_code"],
-            )
+        database and host never change, so the children are looked up once
+        here instead of through labels() on every check. Error-code
+        children are bound on first use and memoized per error code.
+        """
+        labels = {"database": self.database, "host": self.host}
+        self._status_child = self._connection_status.labels(**labels)
+        self._duration_child = self._check_duration.labels(**labels)
+        self._success_child = self._checks_total.labels(**labels, status="success")
+        self._failure_child = self._checks_total.labels(**labels, status="failure")
+        # Indexed by is_success(): False -> failure, True -> success
+        self._check_children = (self._failure_child, self._success_child)
+        self._error_child: Callable[[str], Any] = functools.lru_cache(maxsize=64)(
+            self._bind_error_child
+        )
+
+    def _bind_error_child(self, error_code: str) -> Any:
+        """
+        Bind the error counter child for an error code.
 
-            logger.info(
-                f"Metrics collector initialized for {database}@{host} "
-                f"(metrics server will be on {metrics_host}:{port})"
-            )
+        Args:
+            error_code: Error code label value
 
-        except ImportError:
-            self._prometheus_available = False
-            logger.warning(
-                "prometheus-client not installed. Metrics collection disabled. "
-                "Install with: pip install prometheus-client"
-            )
+        Returns:
+            Bound counter child for the error code
+        """
+        return self._errors_total.labels(
+            database=self.database, host=self.host, error_code=error_code
+        )
 
     def start_server(self) -> None:
         """
         Start the Prometheus metrics HTTP server.
 
         Raises:
-            RuntimeError: If prometheus-client is not available
+            RuntimeError: If prometheus-client is not available or the
+                collector has been shut down
             OSError: If port is already in use
         """
         if not self._prometheus_available:
@@ -132,19 +215,27 @@ class MetricsCollector:
                 "prometheus-client not installed. Cannot start metrics server."
             )
 
+        if self._registry is None:
+            raise RuntimeError("Metrics collector has been shut down.")
+
         if self._server_started:
             logger.warning(
-                f"Metrics server already started on {self.metrics_host}:{self.port}"
+                "Metrics server already started on %s:%s", self.metrics_host, self.port
             )
             return
 
         try:
             # start_http_server returns (server, thread) tuple
-            server_info = self._start_http_server(self.port, addr=self.metrics_host)
+            server_info = start_http_server(
+                self.port, addr=self.metrics_host, registry=self._registry
+            )
             self._server = server_info[0] if server_info else None
             self._server_started = True
-            url = f"http://{self.metrics_host}:{self.port}/metrics"
-            logger.info(f"Metrics server started on {url}")
+            logger.info(
+                "Metrics server started on http://%s:%s/metrics",
+                self.metrics_host,
+                self.port,
+            )
         except OSError as e:
             if "Address already in use" in str(e):
                 raise OSError(
@@ -157,38 +248,49 @@ class MetricsCollector:
         """
         Record a health check result.
 
+        Only pre-bound children are touched, so a check takes just each
+        child's own value lock; the parent metrics' labels() lock is never
+        acquired here. Updates are applied synchronously: checks arrive at
+        most once per check interval, so there is nothing to batch, and a
+        scrape always sees the latest result.
+
         Args:
             result: Health check result to record
         """
-        if not self._prometheus_available:
-            return
-
-        labels = {"database": self.database, "host": self.host}
+        success = result.is_success()
 
-        # Update connection status
-        status_value = 1 if result.is_success() else 0
-        self._connection_status.labels(**labels).set(status_value)
+        # Update connection status (Gauge.set stores the bool as 1.0 / 0.0)
+        self._status_child.set(success)
 
         # Record check duration
-        duration_seconds = result.response_time_ms / 1000.0
-        self._check_duration.labels(**labels).observe(duration_seconds)
+        self._duration_child.observe(result.response_time_seconds)
 
         # Increment check counter
-        status_label = "success" if result.is_success() else "failure"
-        self._checks_total.labels(**labels, status=status_label).inc()
+        self._check_children[success].inc()
 
         # Record errors
-        if not result.is_success() and result.error_code:
-            self._errors_total.labels(
-                **labels, error_code=result.error_code
-            ).inc()
+        if not success:
+            error_code = result.error_code
+            if error_code:
+                if error_code not in ERROR_CODES:
+                    error_code = OTHER_ERROR_CODE
+                self._error_child(error_code).inc()
+
+    def _record_nothing(self, result: HealthCheckResult) -> None:
+        """
+        Stand-in for record_check when prometheus-client is not installed.
+
+        Args:
+            result: Health check result (ignored)
+        """
 
     def shutdown(self) -> None:
         """
-        Shutdown the metrics HTTP server.
+        Shutdown the metrics HTTP server and release the metrics.
 
         This method should be called during application shutdown to properly
-        clean up the background server thread.
+        clean up the background server thread. The collector's registry and
+        metrics are dropped, so later record_check() calls do nothing.
         """
         if self._server is not None:
             try:
@@ -197,4 +299,22 @@ class MetricsCollector:
                 self._server = None
                 logger.info("Metrics server shut down")
             except Exception as e:
-                logger.warning(f"Error shutting down metrics server: {e}")
+                logger.warning("Error shutting down metrics server: %s", e)
+
+        if self._registry is not None:
+            self._release_metrics()
+
+    def _release_metrics(self) -> None:
+        """
+        Drop the registry, the metrics and their bound children.
+
+        Nothing else references them, so they are freed as soon as the
+        collector lets go; from then on checks are no longer recorded.
+        """
+        self.record_check = self._record_nothing  # type: ignore[method-assign]
+        self._registry = None
+        del self._connection_status, self._check_duration
+        del self._checks_total, self._errors_total
+        del self._status_child, self._duration_child
+        del self._success_child, self._failure_child, self._check_children
+        del self._error_child
@@ -5,12 +5,50 @@ This module contains all data classes used throughout the application,
 including configuration models and result objects.
 """
 
+import re
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, Tuple
-
-
-@dataclass
+from typing import FrozenSet, Optional, Tuple
+
+# Default histogram buckets in seconds (includes 5.0s to match connection timeout)
+DEFAULT_HISTOGRAM_BUCKETS: Tuple[float, ...] = (
+    0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0
+)
+
+
+# dataclass(slots=True) needs Python 3.10; older versions keep __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Error codes DatabaseChecker reports on failed checks
+ERROR_CODES: FrozenSet[str] = frozenset(
+    {
+        "CONNECTION_ERROR",
+        "AUTHENTICATION_ERROR",
+        "PERMISSION_ERROR",
+        "DATABASE_NOT_FOUND",
+        "TOO_MANY_CONNECTIONS",
+        "QUERY_TIMEOUT",
+        "DATABASE_ERROR",
+        "UNKNOWN_ERROR",
+    }
+)
+
+# Accepted values for the enumerated config options
+_VALID_SSL_MODES = frozenset(
+    {"disable", "allow", "prefer", "require", "verify-ca", "verify-full"}
+)
+_VALID_BACKOFF = frozenset({"fixed", "linear", "exponential"})
+_VALID_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR"})
+_VALID_OUTPUTS = frozenset({"console", "file", "both"})
+_VALID_FORMATS = frozenset({"text", "json"})
+
+# Data modification statements a health check query must not contain,
+# matched as whole words so column names like create_date are allowed
+_MODIFICATION_SQL_RE = re.compile(r"\b(DROP|DELETE|UPDATE|INSERT|ALTER|CREATE)\b")
+
+
+@dataclass(**_SLOTS)
 class HealthCheckResult:
     """
     Result of a database health check.
@@ -21,7 +59,9 @@ class HealthCheckResult:
     Attributes:
         timestamp: When the check was performed (UTC)
         status: Either "success" or "failure"
-        response_time_ms: Time taken for the check in milliseconds
+        response_time_ms: Time taken for the check in milliseconds; on a
+            connection kept from an earlier check this is the query round
+            trip only, connection setup is included when the check connects
         error_code: Optional error code for failures (e.g., "CONNECTION_ERROR")
         error_message: Optional sanitized error message
     """
@@ -36,6 +76,11 @@ class HealthCheckResult:
         """Check if the health check was successful."""
         return self.status == "success"
 
+    @property
+    def response_time_seconds(self) -> float:
+        """Time taken for the check in seconds."""
+        return self.response_time_ms / 1000.0
+
     def __str__(self) -> str:
         """String representation for logging."""
         if self.is_success():
@@ -44,7 +89,7 @@ class HealthCheckResult:
             return f"Health check failed - {self.error_code}: {self.error_message}"
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class DatabaseConfig:
     """
     Database connection configuration.
@@ -88,18 +133,10 @@ class DatabaseConfig:
             )
 
         # Validate SSL mode
-        valid_ssl_modes = [
-            "disable",
-            "allow",
-            "prefer",
-            "require",
-            "verify-ca",
-            "verify-full",
-        ]
-        if self.ssl_mode not in valid_ssl_modes:
+        if self.ssl_mode not in _VALID_SSL_MODES:
             raise ValueError(
                 f"Invalid ssl_mode '{self.ssl_mode}'. "
-                f"Valid options: {', '.join(valid_ssl_modes)}"
+                f"Valid options: {', '.join(sorted(_VALID_SSL_MODES))}"
             )
 
         # Validate port
@@ -113,7 +150,7 @@ class DatabaseConfig:
             raise ValueError("statement_timeout must be at least 1 second")
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class MonitorConfig:
     """
     Monitoring behavior configuration.
@@ -144,11 +181,10 @@ class MonitorConfig:
         if self.max_retries < 0:
             raise ValueError("max_retries must be non-negative")
 
-        valid_backoff = ["fixed", "linear", "exponential"]
-        if self.retry_backoff not in valid_backoff:
+        if self.retry_backoff not in _VALID_BACKOFF:
             raise ValueError(
                 f"Invalid retry_backoff '{self.retry_backoff}'. "
-                f"Valid options: {', '.join(valid_backoff)}"
+                f"Valid options: {', '.join(sorted(_VALID_BACKOFF))}"
             )
 
         if self.retry_delay < 1:
@@ -159,16 +195,13 @@ class MonitorConfig:
         query = self.health_check_query.strip().upper()
         if not query.startswith("SELECT"):
             raise ValueError("health_check_query must be a SELECT statement")
-        if any(
-            keyword in query
-            for keyword in ["DROP", "DELETE", "UPDATE", "INSERT", "ALTER", "CREATE"]
-        ):
+        if _MODIFICATION_SQL_RE.search(query):
             raise ValueError(
                 "health_check_query cannot contain data modification statements"
             )
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class LoggingConfig:
     """
     Logging configuration.
@@ -195,26 +228,25 @@ class LoggingConfig:
 
     def __post_init__(self) -> None:
         """Validate logging configuration."""
-        valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR"]
-        if self.level.upper() not in valid_levels:
+        level = self.level.upper()
+        if level not in _VALID_LEVELS:
             raise ValueError(
                 f"Invalid log level '{self.level}'. "
-                f"Valid options: {', '.join(valid_levels)}"
+                f"Valid options: {', '.join(sorted(_VALID_LEVELS))}"
             )
-        self.level = self.level.upper()
+        # Frozen, so normalise through object.__setattr__
+        object.__setattr__(self, "level", level)
 
-        valid_outputs = ["console", "file", "both"]
-        if self.output not in valid_outputs:
+        if self.output not in _VALID_OUTPUTS:
             raise ValueError(
                 f"Invalid output '{self.output}'. "
-                f"Valid options: {', '.join(valid_outputs)}"
+                f"Valid options: {', '.join(sorted(_VALID_OUTPUTS))}"
             )
 
-        valid_formats = ["text", "json"]
-        if self.format not in valid_formats:
+        if self.format not in _VALID_FORMATS:
             raise ValueError(
                 f"Invalid format '{self.format}'. "
-                f"Valid options: {', '.join(valid_formats)}"
+                f"Valid options: {', '.join(sorted(_VALID_FORMATS))}"
             )
 
         if self.max_file_size < 1024:  # Minimum 1KB
@@ -224,7 +256,7 @@ class LoggingConfig:
             raise ValueError("backup_count must be non-negative")
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class MetricsConfig:
     """
     Prometheus metrics configuration.
@@ -239,9 +271,7 @@ class MetricsConfig:
     enabled: bool = False
     port: int = 9090
     host: str = "0.0.0.0"
-    histogram_buckets: Tuple[float, ...] = (
-        0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0
-    )
+    histogram_buckets: Tuple[float, ...] = DEFAULT_HISTOGRAM_BUCKETS
 
     def __post_init__(self) -> None:
         """Validate metrics configuration."""
@@ -253,7 +283,7 @@ class MetricsConfig:
             raise ValueError("histogram_buckets values must be positive")
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class Config:
     """
     Complete application configuration.
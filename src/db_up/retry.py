@@ -8,13 +8,22 @@ This module provides retry functionality with configurable backoff strategies:
 - Jitter: Optional randomness to prevent thundering herd
 """
 
+import logging
 import time
 import random
-from typing import Any, Callable, Literal, Optional, TypeVar
+import threading
+from typing import Any, Callable, Dict, Literal, Optional, TypeVar
 from db_up.models import MonitorConfig
 
 T = TypeVar("T")
 
+# Delay multiplier for a 1-based attempt number, by backoff strategy
+_BACKOFF_MULTIPLIERS: Dict[str, Callable[[int], float]] = {
+    "fixed": lambda attempt: 1,
+    "linear": lambda attempt: attempt,
+    "exponential": lambda attempt: 2 ** (attempt - 1),
+}
+
 
 def calculate_backoff(
     attempt: int, base_delay: int, strategy: str = "exponential", jitter: bool = True
@@ -39,28 +48,64 @@ def calculate_backoff(
         >>> calculate_backoff(2, 5, 'exponential', jitter=False)
         10.0
     """
-    if strategy == "fixed":
-        delay = float(base_delay)
-    elif strategy == "linear":
-        delay = float(base_delay * attempt)
-    elif strategy == "exponential":
-        delay = float(base_delay * (2 ** (attempt - 1)))
-    else:
+    multiplier = _BACKOFF_MULTIPLIERS.get(strategy)
+    if multiplier is None:
         raise ValueError(f"Invalid backoff strategy: {strategy}")
+    delay = float(base_delay * multiplier(attempt))
 
     # Add jitter if enabled
     if jitter:
-        # Add random jitter of ±20%
-        jitter_amount = delay * 0.2
-        delay += random.uniform(-jitter_amount, jitter_amount)
+        # Scale by a random factor in [0.8, 1.2), i.e. ±20%
+        delay *= 0.8 + 0.4 * random.random()
         # Ensure delay is never negative
-        delay = max(0.1, delay)
+        if delay < 0.1:
+            delay = 0.1
 
     return delay
 
 
+def _level_enabled(logger: Any, level: int) -> bool:
+    """
+    Check whether a logger would emit a record at the given level.
+
+    Loggers without isEnabledFor() (any object with info/warning/error
+    methods is accepted) are treated as having every level enabled. For
+    the same reason messages are passed preformatted rather than with
+    %-style arguments: such loggers only need to take (msg, extra=...).
+
+    Args:
+        logger: Logger to check
+        level: Logging level of the message
+
+    Returns:
+        True if the message should be built and logged
+    """
+    is_enabled_for = getattr(logger, "isEnabledFor", None)
+    return is_enabled_for is None or bool(is_enabled_for(level))
+
+
+def _wait_before_retry(delay: float, cancel_event: Optional[threading.Event]) -> bool:
+    """
+    Sleep for the backoff delay, waking early if retries are cancelled.
+
+    Args:
+        delay: Delay in seconds
+        cancel_event: Optional event that cancels retrying when set
+
+    Returns:
+        True if retrying was cancelled, False once the delay has elapsed
+    """
+    if cancel_event is None:
+        time.sleep(delay)
+        return False
+    return cancel_event.wait(delay)
+
+
 def retry_with_backoff(
-    func: Callable[[], T], config: MonitorConfig, logger: Optional[Any] = None
+    func: Callable[[], T],
+    config: MonitorConfig,
+    logger: Optional[Any] = None,
+    cancel_event: Optional[threading.Event] = None,
 ) -> T:
     """
     Execute a function with retry logic and backoff.
@@ -72,12 +117,14 @@ def retry_with_backoff(
         func: Function to execute (should return a result)
         config: Monitor configuration with retry settings
         logger: Optional logger for logging retry attempts
+        cancel_event: Optional event that, once set, interrupts the wait
+            before the next retry and stops retrying (e.g. on shutdown)
 
     Returns:
         Result from the function
 
     Raises:
-        Exception: The last exception if all retries fail
+        Exception: The last exception if all retries fail or are cancelled
 
     Example:
         >>> def check_db():
@@ -93,8 +140,13 @@ def retry_with_backoff(
         try:
             result = func()
 
-            # Log recovery if this was a retry
-            if attempt > 0 and logger:
+            # Log recovery if this was a retry (messages and their extra
+            # dicts are only built when the level is enabled)
+            if (
+                attempt > 0
+                and logger is not None
+                and _level_enabled(logger, logging.INFO)
+            ):
                 logger.info(
                     f"Operation succeeded after {attempt} retries",
                     extra={"retry_attempt": attempt},
@@ -107,7 +159,7 @@ def retry_with_backoff(
 
             # If this was the last attempt, don't retry
             if attempt >= config.max_retries:
-                if logger:
+                if logger is not None and _level_enabled(logger, logging.ERROR):
                     logger.error(
                         f"Operation failed after {config.max_retries} retries",
                         extra={
@@ -126,7 +178,7 @@ def retry_with_backoff(
             )
 
             # Log retry attempt
-            if logger:
+            if logger is not None and _level_enabled(logger, logging.WARNING):
                 logger.warning(
                     f"Operation failed, retrying in {delay:.1f}s "
                     f"(attempt {attempt + 1}/{config.max_retries})",
@@ -138,9 +190,10 @@ def retry_with_backoff(
                 )
 
             # Wait before retrying
-            time.sleep(delay)
+            if _wait_before_retry(delay, cancel_event):
+                break
 
-    # All retries exhausted, raise the last exception
+    # All retries exhausted or cancelled, raise the last exception
     if last_exception:
         raise last_exception
 
@@ -167,16 +220,24 @@ class RetryContext:
         ...             retry.failure(e)
     """
 
-    def __init__(self, config: MonitorConfig, logger: Optional[Any] = None):
+    def __init__(
+        self,
+        config: MonitorConfig,
+        logger: Optional[Any] = None,
+        cancel_event: Optional[threading.Event] = None,
+    ):
         """
         Initialize retry context.
 
         Args:
             config: Monitor configuration with retry settings
             logger: Optional logger
+            cancel_event: Optional event that, once set, interrupts the wait
+                before the next retry and stops retrying
         """
         self.config = config
         self.logger = logger
+        self.cancel_event = cancel_event
         self.attempt = 0
         self.last_exception: Optional[Exception] = None
         self._success = False
@@ -199,7 +260,7 @@ class RetryContext:
         Check if should attempt/retry.
 
         Returns:
-            True if should attempt, False if retries exhausted
+            True if should attempt, False if retries exhausted or cancelled
         """
         if self._success:
             return False
@@ -216,7 +277,7 @@ class RetryContext:
                 self.config.retry_jitter,
             )
 
-            if self.logger:
+            if self.logger is not None and _level_enabled(self.logger, logging.WARNING):
                 self.logger.warning(
                     f"Retrying in {delay:.1f}s "
                     f"(attempt {self.attempt}/{self.config.max_retries})",
@@ -227,7 +288,8 @@ class RetryContext:
                     },
                 )
 
-            time.sleep(delay)
+            if _wait_before_retry(delay, self.cancel_event):
+                return False
 
         self.attempt += 1
         return True
@@ -236,7 +298,11 @@ class RetryContext:
         """Mark the operation as successful."""
         self._success = True
 
-        if self.attempt > 1 and self.logger:
+        if (
+            self.attempt > 1
+            and self.logger is not None
+            and _level_enabled(self.logger, logging.INFO)
+        ):
             self.logger.info(
                 f"Operation succeeded after {self.attempt - 1} retries",
                 extra={"retry_attempt": self.attempt - 1},
@@ -251,7 +317,11 @@ class RetryContext:
         """
         self.last_exception = exception
 
-        if self.attempt > self.config.max_retries and self.logger:
+        if (
+            self.attempt > self.config.max_retries
+            and self.logger is not None
+            and _level_enabled(self.logger, logging.ERROR)
+        ):
             self.logger.error(
                 f"Operation failed after {self.config.max_retries} retries",
                 extra={
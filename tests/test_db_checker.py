@@ -1,27 +1,71 @@
 """Tests for database checker module."""
 
+import time
+from datetime import timezone
+from typing import Any, List
 from unittest.mock import Mock, patch, MagicMock
 import psycopg2
-from db_up.db_checker import DatabaseChecker, create_checker
-from db_up.models import DatabaseConfig
+import pytest
+from db_up.db_checker import _ERROR_PATTERNS, DatabaseChecker, create_checker
+from db_up.models import ERROR_CODES, DatabaseConfig
+
+
+class FakeCursor:
+    """Minimal stand-in for a psycopg2 cursor that records executed SQL."""
+
+    def __init__(self, result: Any = (1,)) -> None:
+        self.result = result
+        self.executed: List[Any] = []
+        self.close_count = 0
+
+    def execute(self, query: Any, params: Any = None) -> None:
+        self.executed.append(query)
+
+    def fetchone(self) -> Any:
+        return self.result
+
+    def close(self) -> None:
+        self.close_count += 1
+
+
+class FakeConnection:
+    """Minimal stand-in for a psycopg2 connection handing out one cursor."""
+
+    def __init__(self, cursor: FakeCursor) -> None:
+        self._cursor = cursor
+        self.autocommit = False
+        self.closed = 0
+        self.cursor_count = 0
+        self.close_count = 0
+
+    def cursor(self) -> FakeCursor:
+        self.cursor_count += 1
+        return self._cursor
+
+    def close(self) -> None:
+        self.closed = 1
+        self.close_count += 1
+
+
+@pytest.fixture(scope="module")
+def base_config() -> DatabaseConfig:
+    """Shared config for tests that don't need their own settings."""
+    return DatabaseConfig(database="testdb", password="secret")
 
 
 class TestDatabaseChecker:
     """Tests for DatabaseChecker class."""
 
+    @pytest.fixture
+    def checker(self, base_config: DatabaseConfig) -> DatabaseChecker:
+        """Fresh checker built on the shared config."""
+        return DatabaseChecker(base_config)
+
     @patch("db_up.db_checker.psycopg2.connect")
-    def test_successful_health_check(self, mock_connect) -> None:
+    def test_successful_health_check(self, mock_connect, checker) -> None:
         """Test successful health check returns correct result."""
-        # Setup mocks
-        mock_conn = MagicMock()
-        mock_cursor = MagicMock()
-        mock_cursor.fetchone.return_value = (1,)
-        mock_conn.cursor.return_value = mock_cursor
-        mock_connect.return_value = mock_conn
-
-        # Create checker
-        config = DatabaseConfig(database="testdb", password="secret")
-        checker = DatabaseChecker(config)
+        cursor = FakeCursor()
+        mock_connect.return_value = FakeConnection(cursor)
 
         # Execute
         result = checker.check_connection()
@@ -33,18 +77,14 @@ class TestDatabaseChecker:
         assert result.error_code is None
 
         # Verify security settings were applied
-        calls = [str(call) for call in mock_cursor.execute.call_args_list]
-        assert any("READ ONLY" in str(call) for call in calls)
-        assert any("statement_timeout" in str(call) for call in calls)
+        assert any("READ ONLY" in str(query) for query in cursor.executed)
+        assert any("statement_timeout" in str(query) for query in cursor.executed)
 
     @patch("db_up.db_checker.psycopg2.connect")
-    def test_connection_refused(self, mock_connect) -> None:
+    def test_connection_refused(self, mock_connect, checker) -> None:
         """Test connection refused error is handled correctly."""
         mock_connect.side_effect = psycopg2.OperationalError("connection refused")
 
-        config = DatabaseConfig(database="testdb", password="secret")
-        checker = DatabaseChecker(config)
-
         result = checker.check_connection()
 
         assert not result.is_success()
@@ -53,94 +93,193 @@ class TestDatabaseChecker:
         assert "refused" in result.error_message.lower()
 
     @patch("db_up.db_checker.psycopg2.connect")
-    def test_authentication_error(self, mock_connect) -> None:
-        """Test authentication error is classified correctly."""
-        mock_connect.side_effect = psycopg2.DatabaseError("authentication failed")
+    def test_errors_are_classified(self, mock_connect, checker) -> None:
+        """Test that connection errors map to the expected error codes."""
+        cases = [
+            (psycopg2.DatabaseError("authentication failed"), "AUTHENTICATION_ERROR"),
+            (
+                psycopg2.DatabaseError('database "testdb" does not exist'),
+                "DATABASE_NOT_FOUND",
+            ),
+            (psycopg2.DatabaseError("too many connections"), "TOO_MANY_CONNECTIONS"),
+            (
+                psycopg2.DatabaseError("canceling statement due to statement timeout"),
+                "QUERY_TIMEOUT",
+            ),
+            # Categories keep their priority when a message mentions several
+            (
+                psycopg2.DatabaseError("database x password does not exist"),
+                "AUTHENTICATION_ERROR",
+            ),
+            (
+                psycopg2.DatabaseError("role does not exist in database x"),
+                "DATABASE_NOT_FOUND",
+            ),
+            (RuntimeError("unexpected error"), "UNKNOWN_ERROR"),
+        ]
+
+        for error, expected_code in cases:
+            mock_connect.side_effect = error
+
+            result = checker.check_connection()
+
+            assert not result.is_success()
+            assert result.error_code == expected_code, error
 
-        config = DatabaseConfig(database="testdb", password="secret")
-        checker = DatabaseChecker(config)
+    @patch("db_up.db_checker.psycopg2.connect")
+    def test_connection_kept_open_on_success(self, mock_connect, checker) -> None:
+        """Test that the cursor and connection stay open after a check."""
+        cursor = FakeCursor()
+        conn = FakeConnection(cursor)
+        mock_connect.return_value = conn
 
-        result = checker.check_connection()
+        checker.check_connection()
 
-        assert not result.is_success()
-        assert result.error_code == "AUTHENTICATION_ERROR"
+        # Cursor and connection are kept for the next check
+        assert conn.cursor_count == 1
+        assert cursor.close_count == 0
+        assert conn.close_count == 0
+        assert conn.autocommit is True
 
     @patch("db_up.db_checker.psycopg2.connect")
-    def test_database_not_found(self, mock_connect) -> None:
-        """Test database not found error is classified correctly."""
-        mock_connect.side_effect = psycopg2.DatabaseError(
-            'database "testdb" does not exist'
-        )
+    def test_connection_reused_between_checks(self, mock_connect, checker) -> None:
+        """Test that an open connection is reused by later checks."""
+        cursor = FakeCursor()
+        conn = FakeConnection(cursor)
+        mock_connect.return_value = conn
 
-        config = DatabaseConfig(database="testdb", password="secret")
-        checker = DatabaseChecker(config)
-
-        result = checker.check_connection()
+        assert checker.check_connection().is_success()
+        assert checker.check_connection().is_success()
 
-        assert not result.is_success()
-        assert result.error_code == "DATABASE_NOT_FOUND"
+        mock_connect.assert_called_once()
+        assert conn.cursor_count == 1
+        assert cursor.executed.count("SELECT 1 AS health_check") == 2
+        assert sum("READ ONLY" in str(s) for s in cursor.executed) == 1
 
     @patch("db_up.db_checker.psycopg2.connect")
-    def test_too_many_connections(self, mock_connect) -> None:
-        """Test too many connections error is classified correctly."""
-        mock_connect.side_effect = psycopg2.DatabaseError("too many connections")
-
-        config = DatabaseConfig(database="testdb", password="secret")
-        checker = DatabaseChecker(config)
+    def test_reconnect_after_error(self, mock_connect, checker) -> None:
+        """Test that a failed check drops the connection and reconnects."""
+        mock_conn = MagicMock()
+        mock_conn.closed = 0
+        mock_cursor = MagicMock()
+        mock_cursor.fetchone.side_effect = [
+            psycopg2.OperationalError("server closed the connection"),
+            (1,),
+        ]
+        mock_conn.cursor.return_value = mock_cursor
+        mock_connect.return_value = mock_conn
 
-        result = checker.check_connection()
+        assert not checker.check_connection().is_success()
+        mock_conn.close.assert_called_once()
 
-        assert not result.is_success()
-        assert result.error_code == "TOO_MANY_CONNECTIONS"
+        assert checker.check_connection().is_success()
+        assert mock_connect.call_count == 2
 
     @patch("db_up.db_checker.psycopg2.connect")
-    def test_query_timeout(self, mock_connect) -> None:
-        """Test query timeout error is classified correctly."""
-        mock_connect.side_effect = psycopg2.DatabaseError(
-            "canceling statement due to statement timeout"
-        )
-
-        config = DatabaseConfig(database="testdb", password="secret")
-        checker = DatabaseChecker(config)
+    def test_stale_connection_retried_on_new_connection(
+        self, mock_connect, checker
+    ) -> None:
+        """Test that a dropped kept connection doesn't fail the check."""
+        stale_cursor = MagicMock()
+        stale_cursor.fetchone.side_effect = [
+            (1,),
+            psycopg2.OperationalError("server closed the connection"),
+        ]
+        stale_conn = MagicMock()
+        stale_conn.closed = 0
+        stale_conn.cursor.return_value = stale_cursor
+        fresh_conn = FakeConnection(FakeCursor())
+        mock_connect.side_effect = [stale_conn, fresh_conn]
+
+        assert checker.check_connection().is_success()
+        assert checker.check_connection().is_success()
+
+        stale_conn.close.assert_called_once()
+        assert mock_connect.call_count == 2
 
+    @patch("db_up.db_checker.psycopg2.connect")
+    def test_stale_connection_retried_only_once(self, mock_connect, checker) -> None:
+        """Test that a failing reconnect is reported as a connection error."""
+        stale_cursor = MagicMock()
+        stale_cursor.fetchone.side_effect = [
+            (1,),
+            psycopg2.OperationalError("server closed the connection"),
+        ]
+        stale_conn = MagicMock()
+        stale_conn.closed = 0
+        stale_conn.cursor.return_value = stale_cursor
+        mock_connect.side_effect = [
+            stale_conn,
+            psycopg2.OperationalError("could not connect to server"),
+        ]
+
+        assert checker.check_connection().is_success()
         result = checker.check_connection()
 
-        assert not result.is_success()
-        assert result.error_code == "QUERY_TIMEOUT"
+        assert result.error_code == "CONNECTION_ERROR"
+        assert mock_connect.call_count == 2
 
     @patch("db_up.db_checker.psycopg2.connect")
-    def test_unexpected_error(self, mock_connect) -> None:
-        """Test unexpected error is handled gracefully."""
-        mock_connect.side_effect = RuntimeError("unexpected error")
+    def test_query_error_on_kept_connection_not_retried(
+        self, mock_connect, checker
+    ) -> None:
+        """Test that only connection-level errors trigger the retry."""
+        cursor = MagicMock()
+        cursor.fetchone.side_effect = [
+            (1,),
+            psycopg2.DatabaseError("permission denied for relation"),
+        ]
+        conn = MagicMock()
+        conn.closed = 0
+        conn.cursor.return_value = cursor
+        mock_connect.return_value = conn
+
+        assert checker.check_connection().is_success()
+        result = checker.check_connection()
 
-        config = DatabaseConfig(database="testdb", password="secret")
-        checker = DatabaseChecker(config)
+        assert result.error_code == "PERMISSION_ERROR"
+        mock_connect.assert_called_once()
 
+    @patch("db_up.db_checker.psycopg2.connect")
+    def test_statement_timeout_on_kept_connection_not_retried(
+        self, mock_connect, checker
+    ) -> None:
+        """Test that a statement timeout is reported without re-running."""
+        cursor = MagicMock()
+        cursor.fetchone.side_effect = [
+            (1,),
+            psycopg2.extensions.QueryCanceledError(
+                "canceling statement due to statement timeout"
+            ),
+        ]
+        conn = MagicMock()
+        conn.closed = 0
+        conn.cursor.return_value = cursor
+        mock_connect.return_value = conn
+
+        assert checker.check_connection().is_success()
         result = checker.check_connection()
 
         assert not result.is_success()
-        assert result.error_code == "UNKNOWN_ERROR"
+        assert cursor.fetchone.call_count == 2
+        mock_connect.assert_called_once()
 
     @patch("db_up.db_checker.psycopg2.connect")
-    def test_connection_cleanup_on_success(self, mock_connect) -> None:
-        """Test that connections are cleaned up on success."""
-        mock_conn = MagicMock()
-        mock_cursor = MagicMock()
-        mock_cursor.fetchone.return_value = (1,)
-        mock_conn.cursor.return_value = mock_cursor
-        mock_connect.return_value = mock_conn
-
-        config = DatabaseConfig(database="testdb", password="secret")
-        checker = DatabaseChecker(config)
+    def test_close_closes_connection(self, mock_connect, checker) -> None:
+        """Test that close() closes the persistent connection."""
+        cursor = FakeCursor()
+        conn = FakeConnection(cursor)
+        mock_connect.return_value = conn
 
         checker.check_connection()
+        checker.close()
+        checker.close()  # Safe to call twice
 
-        # Verify cleanup was called
-        mock_cursor.close.assert_called_once()
-        mock_conn.close.assert_called_once()
+        assert cursor.close_count == 1
+        assert conn.close_count == 1
 
     @patch("db_up.db_checker.psycopg2.connect")
-    def test_connection_cleanup_on_error(self, mock_connect) -> None:
+    def test_connection_cleanup_on_error(self, mock_connect, checker) -> None:
         """SECURITY: Test that connections are cleaned up even on error."""
         mock_conn = MagicMock()
         mock_cursor = MagicMock()
@@ -148,9 +287,6 @@ class TestDatabaseChecker:
         mock_conn.cursor.return_value = mock_cursor
         mock_connect.return_value = mock_conn
 
-        config = DatabaseConfig(database="testdb", password="secret")
-        checker = DatabaseChecker(config)
-
         checker.check_connection()
 
         # Verify cleanup was attempted
@@ -193,6 +329,16 @@ class TestDatabaseChecker:
         assert result.response_time_ms == 45.0
         assert mock_timer.call_count == 2
 
+    @patch("db_up.db_checker.psycopg2.connect")
+    def test_timestamp_is_utc(self, mock_connect, checker) -> None:
+        """Test that results carry a timezone-aware UTC timestamp."""
+        mock_connect.side_effect = psycopg2.OperationalError("connection refused")
+
+        result = checker.check_connection()
+
+        assert result.timestamp.tzinfo == timezone.utc
+
+    @patch("db_up.db_checker._HAS_TCP_USER_TIMEOUT", True)
     @patch("db_up.db_checker.psycopg2.connect")
     def test_connection_parameters(self, mock_connect) -> None:
         """Test that connection parameters are passed correctly."""
@@ -226,40 +372,48 @@ class TestDatabaseChecker:
             connect_timeout=10,
             sslmode="verify-full",
             application_name="test-app",
+            keepalives=1,
+            keepalives_idle=30,
+            keepalives_interval=10,
+            keepalives_count=3,
+            tcp_user_timeout=10000,
         )
 
+    @patch("db_up.db_checker._HAS_TCP_USER_TIMEOUT", False)
     @patch("db_up.db_checker.psycopg2.connect")
-    def test_unexpected_query_result(self, mock_connect) -> None:
-        """Test that unexpected query result is handled."""
-        mock_conn = MagicMock()
-        mock_cursor = MagicMock()
-        mock_cursor.fetchone.return_value = (2,)  # Wrong result
-        mock_conn.cursor.return_value = mock_cursor
-        mock_connect.return_value = mock_conn
-
+    def test_tcp_user_timeout_omitted_for_old_libpq(self, mock_connect) -> None:
+        """Test that tcp_user_timeout is not passed to libpq older than 12."""
         config = DatabaseConfig(database="testdb", password="secret")
         checker = DatabaseChecker(config)
 
-        result = checker.check_connection()
-
-        assert not result.is_success()
-        assert result.error_code == "UNKNOWN_ERROR"
+        params = checker._build_conn_params()
 
-    @patch("db_up.db_checker.psycopg2.connect")
-    def test_null_query_result(self, mock_connect) -> None:
-        """Test that null query result is handled."""
-        mock_conn = MagicMock()
-        mock_cursor = MagicMock()
-        mock_cursor.fetchone.return_value = None
-        mock_conn.cursor.return_value = mock_cursor
-        mock_connect.return_value = mock_conn
+        assert "tcp_user_timeout" not in params
+        assert params["keepalives"] == 1
 
-        config = DatabaseConfig(database="testdb", password="secret")
+    def test_ssl_verify_disabled_uses_require(self) -> None:
+        """Test that disabling SSL verification downgrades sslmode to require."""
+        config = DatabaseConfig(
+            database="testdb",
+            password="secret",
+            ssl_mode="verify-full",
+            ssl_verify=False,
+        )
         checker = DatabaseChecker(config)
 
-        result = checker.check_connection()
+        assert checker._conn_params["sslmode"] == "require"
 
-        assert not result.is_success()
+    @patch("db_up.db_checker.psycopg2.connect")
+    def test_unexpected_query_results(self, mock_connect, checker) -> None:
+        """Test that any health check result other than (1,) is a failure."""
+        # Wrong value, null row and empty row
+        for fetch_result in [(2,), (0,), None, ()]:
+            mock_connect.return_value = FakeConnection(FakeCursor(fetch_result))
+
+            result = checker.check_connection()
+
+            assert not result.is_success(), fetch_result
+            assert result.error_code == "UNKNOWN_ERROR", fetch_result
 
     @patch("db_up.db_checker.psycopg2.connect")
     def test_redact_hostnames_when_enabled(self, mock_connect) -> None:
@@ -313,6 +467,58 @@ class TestErrorClassification:
 
         assert code == "PERMISSION_ERROR"
 
+    def test_classify_is_case_insensitive(self) -> None:
+        """Test that classification ignores case."""
+        config = DatabaseConfig(database="testdb", password="secret")
+        checker = DatabaseChecker(config)
+
+        error = psycopg2.DatabaseError("FATAL: TOO MANY CONNECTIONS for role")
+        code = checker._classify_database_error(error)
+
+        assert code == "TOO_MANY_CONNECTIONS"
+
+    def test_classify_uses_priority_order(self) -> None:
+        """Test that authentication wins when several categories match."""
+        config = DatabaseConfig(database="testdb", password="secret")
+        checker = DatabaseChecker(config)
+
+        error = psycopg2.DatabaseError("permission denied: password expired")
+        code = checker._classify_database_error(error)
+
+        assert code == "AUTHENTICATION_ERROR"
+
+    def test_classify_mixed_message_uses_priority_order(self) -> None:
+        """Test that a higher-priority phrase wins wherever it appears."""
+        config = DatabaseConfig(database="testdb", password="secret")
+        checker = DatabaseChecker(config)
+
+        cases = [
+            ("database x password does not exist", "AUTHENTICATION_ERROR"),
+            ("does not exist: database x", "DATABASE_NOT_FOUND"),
+            ("database x: too many connections", "TOO_MANY_CONNECTIONS"),
+            ("timeout: role does not exist", "QUERY_TIMEOUT"),
+        ]
+
+        for message, expected_code in cases:
+            error = psycopg2.DatabaseError(message)
+            assert checker._classify_database_error(error) == expected_code, message
+
+    def test_classify_long_message_is_linear(self) -> None:
+        """Test that a long message is classified in a single quick pass."""
+        config = DatabaseConfig(database="testdb", password="secret")
+        checker = DatabaseChecker(config)
+
+        error = psycopg2.DatabaseError(
+            "database " + "x" * 200_000 + " does not exist " + "y" * 200_000
+        )
+        start = time.perf_counter()
+        code = checker._classify_database_error(error)
+        elapsed = time.perf_counter() - start
+
+        assert code == "DATABASE_NOT_FOUND"
+        # A backtracking pattern takes minutes here; one scan takes milliseconds
+        assert elapsed < 1.0
+
     def test_classify_generic_database_error(self) -> None:
         """Test generic database error classification."""
         config = DatabaseConfig(database="testdb", password="secret")
@@ -323,6 +529,10 @@ class TestErrorClassification:
 
         assert code == "DATABASE_ERROR"
 
+    def test_classified_codes_are_known_error_codes(self) -> None:
+        """Test every classified code is in the metrics error code allowlist."""
+        assert {code for code, _ in _ERROR_PATTERNS} <= ERROR_CODES
+
 
 class TestIntegration:
     """Integration tests for database checker."""
@@ -360,9 +570,12 @@ class TestIntegration:
         assert result.timestamp is not None
 
         # Verify security measures were applied
-        execute_calls = [str(call) for call in mock_cursor.execute.call_args_list]
-        assert len(execute_calls) >= 3  # READ ONLY, timeout, SELECT 1
+        queries = [str(call.args[0]) for call in mock_cursor.execute.call_args_list]
+        assert len(queries) >= 3  # READ ONLY, timeout, SELECT 1
+        assert any("READ ONLY" in query for query in queries)
+        assert any("statement_timeout" in query for query in queries)
 
         # Verify cleanup
+        checker.close()
         mock_cursor.close.assert_called_once()
         mock_conn.close.assert_called_once()
@@ -1,8 +1,16 @@
 """Tests for main application module."""
 
+import logging
+import os
 import signal
+import subprocess
+import sys
+import threading
+import time
 from unittest.mock import Mock, MagicMock, patch
-from db_up.main import Application, parse_args, main
+
+import pytest
+from db_up.main import Application, _next_deadline, parse_args, main
 from db_up.models import (
     Config,
     DatabaseConfig,
@@ -33,7 +41,7 @@ class TestApplication:
         assert app.logger is not None
         assert app.checker is not None
 
-    @patch("db_up.main.DatabaseChecker")
+    @patch("db_up.db_checker.DatabaseChecker")
     def test_run_once_success(self, mock_checker_class) -> None:
         """Test run_once with successful health check."""
         # Setup mocks
@@ -56,7 +64,7 @@ class TestApplication:
         assert exit_code == 0
         assert mock_checker.check_connection.called
 
-    @patch("db_up.main.DatabaseChecker")
+    @patch("db_up.db_checker.DatabaseChecker")
     def test_run_once_failure(self, mock_checker_class) -> None:
         """Test run_once with failed health check."""
         # Setup mocks
@@ -82,9 +90,8 @@ class TestApplication:
 
         assert exit_code == 1
 
-    @patch("db_up.main.DatabaseChecker")
-    @patch("db_up.main.time.sleep")
-    def test_run_loop(self, mock_sleep, mock_checker_class) -> None:
+    @patch("db_up.db_checker.DatabaseChecker")
+    def test_run_loop(self, mock_checker_class) -> None:
         """Test main run loop executes checks."""
         # Setup mocks
         mock_checker = Mock()
@@ -107,7 +114,7 @@ class TestApplication:
             if mock_checker.check_connection.call_count >= 3:
                 app.running = False
 
-        mock_sleep.side_effect = stop_after_checks
+        app._stop.wait = Mock(side_effect=stop_after_checks)
 
         app.run()
 
@@ -115,9 +122,8 @@ class TestApplication:
         assert mock_checker.check_connection.call_count == 3
         assert app.check_count == 3
 
-    @patch("db_up.main.DatabaseChecker")
-    @patch("db_up.main.time.sleep")
-    def test_run_handles_errors(self, mock_sleep, mock_checker_class) -> None:
+    @patch("db_up.db_checker.DatabaseChecker")
+    def test_run_handles_errors(self, mock_checker_class) -> None:
         """Test that run loop handles errors gracefully."""
         # Setup mocks
         mock_checker = Mock()
@@ -142,14 +148,91 @@ class TestApplication:
             if mock_checker.check_connection.call_count >= 2:
                 app.running = False
 
-        mock_sleep.side_effect = stop_after_checks
+        app._stop.wait = Mock(side_effect=stop_after_checks)
 
         # Should not raise exception
         app.run()
 
         assert app.check_count == 2
 
-    @patch("db_up.main.DatabaseChecker")
+    @patch("db_up.db_checker.DatabaseChecker")
+    def test_run_skips_success_log_when_info_disabled(self, mock_checker_class) -> None:
+        """Test that the success message isn't built when INFO is disabled."""
+        mock_checker = Mock()
+        mock_checker.check_connection.return_value = HealthCheckResult(
+            timestamp=datetime.utcnow(), status="success", response_time_ms=45.0
+        )
+        mock_checker_class.return_value = mock_checker
+
+        config = Config(
+            database=DatabaseConfig(database="testdb", password="secret"),
+            monitor=MonitorConfig(),
+            logging=LoggingConfig(level="WARNING"),
+        )
+
+        app = Application(config)
+
+        def stop_after_first(*args):
+            app.running = False
+
+        app._stop.wait = Mock(side_effect=stop_after_first)
+
+        with patch.object(app.logger, "log") as mock_log:
+            app.run()
+
+        mock_log.assert_not_called()
+
+    @patch("db_up.db_checker.DatabaseChecker")
+    def test_run_log_records_keep_their_own_extra(self, mock_checker_class) -> None:
+        """Test that reusing the extra dicts doesn't change earlier records."""
+        mock_checker = Mock()
+        mock_checker.check_connection.side_effect = [
+            HealthCheckResult(
+                timestamp=datetime.utcnow(), status="success", response_time_ms=10.0
+            ),
+            HealthCheckResult(
+                timestamp=datetime.utcnow(),
+                status="failure",
+                response_time_ms=20.0,
+                error_code="TIMEOUT",
+                error_message="timed out",
+            ),
+            HealthCheckResult(
+                timestamp=datetime.utcnow(), status="success", response_time_ms=30.0
+            ),
+        ]
+        mock_checker_class.return_value = mock_checker
+
+        config = Config(
+            database=DatabaseConfig(database="testdb", password="secret"),
+            monitor=MonitorConfig(),
+            logging=LoggingConfig(),
+        )
+
+        app = Application(config)
+        records = []
+        handler = logging.Handler()
+        handler.emit = records.append
+        app.logger.addHandler(handler)
+
+        def stop_after_checks(*args):
+            if mock_checker.check_connection.call_count >= 3:
+                app.running = False
+
+        app._stop.wait = Mock(side_effect=stop_after_checks)
+
+        try:
+            app.run()
+        finally:
+            app.logger.removeHandler(handler)
+
+        checks = [r for r in records if hasattr(r, "check_number")]
+        assert [r.check_number for r in checks] == [1, 2, 3]
+        assert [r.status for r in checks] == ["success", "failure", "success"]
+        assert [r.response_time_ms for r in checks] == [10.0, 20.0, 30.0]
+        assert checks[1].error_code == "TIMEOUT"
+
+    @patch("db_up.db_checker.DatabaseChecker")
     def test_signal_handler_stops_application(self, mock_checker_class) -> None:
         """Test that signal handler stops the application."""
         config = Config(
@@ -166,9 +249,109 @@ class TestApplication:
 
         assert app.running is False
 
-    @patch("db_up.main.DatabaseChecker")
-    @patch("db_up.main.time.sleep")
-    def test_check_interval_respected(self, mock_sleep, mock_checker_class) -> None:
+    @patch("db_up.db_checker.DatabaseChecker")
+    def test_signal_interrupts_wait(self, mock_checker_class) -> None:
+        """Test that a signal ends the wait between checks immediately."""
+        checked = threading.Event()
+
+        def check_connection():
+            checked.set()
+            return HealthCheckResult(
+                timestamp=datetime.utcnow(), status="success", response_time_ms=45.0
+            )
+
+        mock_checker = Mock()
+        mock_checker.check_connection.side_effect = check_connection
+        mock_checker_class.return_value = mock_checker
+
+        config = Config(
+            database=DatabaseConfig(database="testdb", password="secret"),
+            monitor=MonitorConfig(check_interval=3600),
+            logging=LoggingConfig(),
+        )
+
+        app = Application(config)
+        thread = threading.Thread(target=app.run)
+        thread.start()
+        assert checked.wait(5)
+
+        app._signal_handler(signal.SIGTERM, None)
+        thread.join(5)
+
+        assert not thread.is_alive()
+        assert app.check_count == 1
+
+    @pytest.mark.skipif(
+        not hasattr(signal, "pthread_sigmask"), reason="requires pthread_sigmask"
+    )
+    @patch("db_up.db_checker.DatabaseChecker")
+    def test_run_receives_signals_on_waiter_thread(self, mock_checker_class) -> None:
+        """Test that run() blocks SIGTERM and stops via the waiter thread."""
+        blocked_during_check = []
+
+        def check_connection():
+            blocked = signal.pthread_sigmask(signal.SIG_BLOCK, [])
+            blocked_during_check.append(signal.SIGTERM in blocked)
+            os.kill(os.getpid(), signal.SIGTERM)
+            return HealthCheckResult(
+                timestamp=datetime.utcnow(), status="success", response_time_ms=45.0
+            )
+
+        mock_checker = Mock()
+        mock_checker.check_connection.side_effect = check_connection
+        mock_checker_class.return_value = mock_checker
+
+        config = Config(
+            database=DatabaseConfig(database="testdb", password="secret"),
+            monitor=MonitorConfig(check_interval=5),
+            logging=LoggingConfig(),
+        )
+
+        app = Application(config)
+        started = time.monotonic()
+        app.run()
+
+        assert time.monotonic() - started < 4
+        assert app.check_count == 1
+        assert blocked_during_check == [True]
+        assert signal.SIGTERM not in signal.pthread_sigmask(signal.SIG_BLOCK, [])
+        assert app._signal_waiter is None
+
+    @patch("db_up.db_checker.DatabaseChecker")
+    def test_run_wakes_on_signal_without_sigwait(
+        self, mock_checker_class, monkeypatch
+    ) -> None:
+        """Test that the wakeup socket ends the wait where sigwait is missing."""
+        monkeypatch.delattr(signal, "pthread_sigmask", raising=False)
+
+        def check_connection():
+            os.kill(os.getpid(), signal.SIGTERM)
+            return HealthCheckResult(
+                timestamp=datetime.utcnow(), status="success", response_time_ms=45.0
+            )
+
+        mock_checker = Mock()
+        mock_checker.check_connection.side_effect = check_connection
+        mock_checker_class.return_value = mock_checker
+
+        config = Config(
+            database=DatabaseConfig(database="testdb", password="secret"),
+            monitor=MonitorConfig(check_interval=5),
+            logging=LoggingConfig(),
+        )
+
+        app = Application(config)
+        started = time.monotonic()
+        app.run()
+
+        assert time.monotonic() - started < 4
+        assert app.check_count == 1
+        assert app._wakeup_selector is None
+        assert app._wakeup_sockets == ()
+
+    @patch("db_up.db_checker.DatabaseChecker")
+    @patch("db_up.main.time.monotonic", return_value=100.0)
+    def test_check_interval_respected(self, mock_monotonic, mock_checker_class) -> None:
         """Test that check interval is respected."""
         mock_checker = Mock()
         mock_result = HealthCheckResult(
@@ -189,12 +372,74 @@ class TestApplication:
         def stop_after_first(*args):
             app.running = False
 
-        mock_sleep.side_effect = stop_after_first
+        app._stop.wait = Mock(side_effect=stop_after_first)
 
         app.run()
 
-        # Should have slept for 30 seconds
-        mock_sleep.assert_called_with(30)
+        # Should have waited 30 seconds
+        app._stop.wait.assert_called_with(30)
+
+    @patch("db_up.db_checker.DatabaseChecker")
+    @patch("db_up.main.time.monotonic", side_effect=[100.0, 102.0])
+    def test_check_duration_does_not_stretch_interval(
+        self, mock_monotonic, mock_checker_class
+    ) -> None:
+        """Test that time spent checking is subtracted from the wait."""
+        mock_checker = Mock()
+        mock_checker.check_connection.return_value = HealthCheckResult(
+            timestamp=datetime.utcnow(), status="success", response_time_ms=2000.0
+        )
+        mock_checker_class.return_value = mock_checker
+
+        config = Config(
+            database=DatabaseConfig(database="testdb", password="secret"),
+            monitor=MonitorConfig(check_interval=30),
+            logging=LoggingConfig(),
+        )
+
+        app = Application(config)
+
+        def stop_after_first(*args):
+            app.running = False
+
+        app._stop.wait = Mock(side_effect=stop_after_first)
+
+        app.run()
+
+        app._stop.wait.assert_called_with(28.0)
+
+
+class TestImports:
+    """Tests for main module import cost."""
+
+    def test_import_defers_heavy_dependencies(self) -> None:
+        """Test that importing db_up.main doesn't load psycopg2 or prometheus."""
+        code = (
+            "import sys, db_up.main; "
+            "print(sorted(m for m in ('psycopg2', 'prometheus_client', 'yaml') "
+            "if m in sys.modules))"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+
+        assert output.strip() == "[]"
+
+
+class TestNextDeadline:
+    """Tests for _next_deadline function."""
+
+    def test_next_deadline_one_interval_later(self) -> None:
+        """Test that the next check is due one interval after the last."""
+        assert _next_deadline(100.0, 30, 105.0) == 130.0
+
+    def test_next_deadline_skips_missed_ticks(self) -> None:
+        """Test that an overrunning check skips missed ticks."""
+        assert _next_deadline(100.0, 30, 175.0) == 190.0
+
+    def test_next_deadline_on_exact_tick(self) -> None:
+        """Test that a check ending exactly on a tick waits a full interval."""
+        assert _next_deadline(100.0, 30, 130.0) == 160.0
 
 
 class TestParseArgs:
@@ -234,7 +479,7 @@ class TestMain:
     """Tests for main function."""
 
     @patch("db_up.main.Application")
-    @patch("db_up.main.load_config")
+    @patch("db_up.config.load_config")
     def test_main_success(self, mock_load_config, mock_app_class) -> None:
         """Test main function with successful execution."""
         # Setup mocks
@@ -252,7 +497,7 @@ class TestMain:
         mock_load_config.assert_called_once()
         mock_app.run_once.assert_called_once()
 
-    @patch("db_up.main.load_config")
+    @patch("db_up.config.load_config")
     def test_main_config_error(self, mock_load_config) -> None:
         """Test main function with configuration error."""
         mock_load_config.side_effect = ValueError("Invalid config")
@@ -263,7 +508,7 @@ class TestMain:
         assert exit_code == 1
 
     @patch("db_up.main.Application")
-    @patch("db_up.main.load_config")
+    @patch("db_up.config.load_config")
     def test_main_keyboard_interrupt(self, mock_load_config, mock_app_class) -> None:
         """Test main function handles KeyboardInterrupt."""
         mock_config = Mock()
@@ -279,7 +524,7 @@ class TestMain:
         assert exit_code == 130
 
     @patch("db_up.main.Application")
-    @patch("db_up.main.load_config")
+    @patch("db_up.config.load_config")
     def test_main_unexpected_error(self, mock_load_config, mock_app_class) -> None:
         """Test main function handles unexpected errors."""
         mock_config = Mock()
@@ -295,7 +540,7 @@ class TestMain:
         assert exit_code == 1
 
     @patch("db_up.main.Application")
-    @patch("db_up.main.load_config")
+    @patch("db_up.config.load_config")
     def test_main_with_config_file(self, mock_load_config, mock_app_class) -> None:
         """Test main function with config file argument."""
         mock_config = Mock()
@@ -315,9 +560,8 @@ class TestMain:
 class TestIntegration:
     """Integration tests for main application."""
 
-    @patch("db_up.main.DatabaseChecker")
-    @patch("db_up.main.time.sleep")
-    def test_complete_application_flow(self, mock_sleep, mock_checker_class) -> None:
+    @patch("db_up.db_checker.DatabaseChecker")
+    def test_complete_application_flow(self, mock_checker_class) -> None:
         """Test complete application flow from start to finish."""
         # Setup realistic scenario
         mock_checker = Mock()
@@ -354,7 +598,7 @@ class TestIntegration:
             if mock_checker.check_connection.call_count >= 3:
                 app.running = False
 
-        mock_sleep.side_effect = stop_after_checks
+        app._stop.wait = Mock(side_effect=stop_after_checks)
 
         app.run()
 
@@ -366,8 +610,8 @@ class TestIntegration:
 class TestMetricsInitialization:
     """Tests for metrics initialization in Application."""
 
-    @patch("db_up.main.MetricsCollector")
-    @patch("db_up.main.DatabaseChecker")
+    @patch("db_up.metrics.MetricsCollector")
+    @patch("db_up.db_checker.DatabaseChecker")
     def test_metrics_enabled_successful_start(
         self, mock_checker_class: Mock, mock_metrics_class: Mock
     ) -> None:
@@ -389,8 +633,8 @@ class TestMetricsInitialization:
         mock_metrics.start_server.assert_called_once()
         assert app.metrics is mock_metrics
 
-    @patch("db_up.main.MetricsCollector")
-    @patch("db_up.main.DatabaseChecker")
+    @patch("db_up.metrics.MetricsCollector")
+    @patch("db_up.db_checker.DatabaseChecker")
     def test_metrics_prometheus_not_available(
         self, mock_checker_class: Mock, mock_metrics_class: Mock
     ) -> None:
@@ -412,8 +656,8 @@ class TestMetricsInitialization:
         assert app.metrics is None
         mock_metrics.start_server.assert_not_called()
 
-    @patch("db_up.main.MetricsCollector")
-    @patch("db_up.main.DatabaseChecker")
+    @patch("db_up.metrics.MetricsCollector")
+    @patch("db_up.db_checker.DatabaseChecker")
     def test_metrics_server_start_failure(
         self, mock_checker_class: Mock, mock_metrics_class: Mock
     ) -> None:
@@ -436,8 +680,8 @@ class TestMetricsInitialization:
         assert app.metrics is None
         mock_metrics.start_server.assert_called_once()
 
-    @patch("db_up.main.MetricsCollector")
-    @patch("db_up.main.DatabaseChecker")
+    @patch("db_up.metrics.MetricsCollector")
+    @patch("db_up.db_checker.DatabaseChecker")
     def test_metrics_disabled_by_config(
         self, mock_checker_class: Mock, mock_metrics_class: Mock
     ) -> None:
@@ -455,12 +699,10 @@ class TestMetricsInitialization:
         assert app.metrics is None
         mock_metrics_class.assert_not_called()
 
-    @patch("db_up.main.MetricsCollector")
-    @patch("db_up.main.DatabaseChecker")
-    @patch("db_up.main.time.sleep")
+    @patch("db_up.metrics.MetricsCollector")
+    @patch("db_up.db_checker.DatabaseChecker")
     def test_shutdown_calls_metrics_shutdown(
         self,
-        mock_sleep: Mock,
         mock_checker_class: Mock,
         mock_metrics_class: Mock,
     ) -> None:
@@ -489,15 +731,15 @@ class TestMetricsInitialization:
         def stop_immediately(*args: object) -> None:
             app.running = False
 
-        mock_sleep.side_effect = stop_immediately
+        app._stop.wait = Mock(side_effect=stop_immediately)
 
         app.run()
 
         # Verify shutdown was called
         mock_metrics.shutdown.assert_called_once()
 
-    @patch("db_up.main.MetricsCollector")
-    @patch("db_up.main.DatabaseChecker")
+    @patch("db_up.metrics.MetricsCollector")
+    @patch("db_up.db_checker.DatabaseChecker")
     def test_shutdown_handles_metrics_error(
         self, mock_checker_class: Mock, mock_metrics_class: Mock
     ) -> None:
@@ -520,8 +762,8 @@ class TestMetricsInitialization:
         app._shutdown()
         mock_metrics.shutdown.assert_called_once()
 
-    @patch("db_up.main.MetricsCollector")
-    @patch("db_up.main.DatabaseChecker")
+    @patch("db_up.metrics.MetricsCollector")
+    @patch("db_up.db_checker.DatabaseChecker")
     def test_run_once_records_metrics(
         self, mock_checker_class: Mock, mock_metrics_class: Mock
     ) -> None:
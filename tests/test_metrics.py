@@ -2,6 +2,9 @@
 Tests for Prometheus metrics collection.
 """
 
+import gc
+import weakref
+
 import pytest
 from datetime import datetime
 from unittest.mock import Mock, patch, MagicMock
@@ -76,22 +79,19 @@ class TestMetricsCollectorWithPrometheus:
 
     @pytest.fixture
     def mock_prometheus(self) -> Mock:
-        """Mock prometheus_client module."""
+        """Mock the prometheus_client names used by db_up.metrics."""
         mock_counter = MagicMock()
         mock_gauge = MagicMock()
         mock_histogram = MagicMock()
         mock_start_http_server = MagicMock()
 
-        with patch.dict(
-            "sys.modules",
-            {
-                "prometheus_client": MagicMock(
-                    Counter=mock_counter,
-                    Gauge=mock_gauge,
-                    Histogram=mock_histogram,
-                    start_http_server=mock_start_http_server,
-                )
-            },
+        with patch.multiple(
+            "db_up.metrics",
+            _PROMETHEUS_AVAILABLE=True,
+            Counter=mock_counter,
+            Gauge=mock_gauge,
+            Histogram=mock_histogram,
+            start_http_server=mock_start_http_server,
         ):
             yield {
                 "Counter": mock_counter,
@@ -133,7 +133,7 @@ class TestMetricsCollectorWithPrometheus:
         collector.start_server()
 
         mock_prometheus["start_http_server"].assert_called_once_with(
-            9090, addr="0.0.0.0"
+            9090, addr="0.0.0.0", registry=collector._registry
         )
         assert collector._server_started is True
 
@@ -209,6 +209,7 @@ class TestMetricsCollectorWithPrometheus:
         collector._check_duration = mock_check_duration
         collector._checks_total = mock_checks_total
         collector._errors_total = mock_errors_total
+        collector._bind_children()
 
         # Create a successful health check result
         result = HealthCheckResult(
@@ -227,7 +228,7 @@ class TestMetricsCollectorWithPrometheus:
         mock_check_duration.labels.assert_called_with(**labels)
         mock_check_duration.labels.return_value.observe.assert_called_with(0.0255)
 
-        mock_checks_total.labels.assert_called_with(**labels, status="success")
+        mock_checks_total.labels.assert_any_call(**labels, status="success")
         mock_checks_total.labels.return_value.inc.assert_called_once()
 
         # Errors should not be recorded for successful checks
@@ -249,6 +250,7 @@ class TestMetricsCollectorWithPrometheus:
         collector._check_duration = mock_check_duration
         collector._checks_total = mock_checks_total
         collector._errors_total = mock_errors_total
+        collector._bind_children()
 
         # Create a failed health check result
         result = HealthCheckResult(
@@ -269,7 +271,7 @@ class TestMetricsCollectorWithPrometheus:
         mock_check_duration.labels.assert_called_with(**labels)
         mock_check_duration.labels.return_value.observe.assert_called_with(0.1)
 
-        mock_checks_total.labels.assert_called_with(**labels, status="failure")
+        mock_checks_total.labels.assert_any_call(**labels, status="failure")
         mock_checks_total.labels.return_value.inc.assert_called_once()
 
         # Errors should be recorded
@@ -294,6 +296,7 @@ class TestMetricsCollectorWithPrometheus:
         collector._check_duration = mock_check_duration
         collector._checks_total = mock_checks_total
         collector._errors_total = mock_errors_total
+        collector._bind_children()
 
         # Record 3 successful checks
         for i in range(3):
@@ -321,6 +324,7 @@ class TestMetricsCollectorWithPrometheus:
         collector._connection_status = MagicMock()
         collector._checks_total = MagicMock()
         collector._errors_total = MagicMock()
+        collector._bind_children()
 
         # Test various response times
         durations_ms = [1.5, 15.0, 150.0, 1500.0]
@@ -355,6 +359,7 @@ class TestMetricsCollectorWithPrometheus:
         collector._check_duration = mock_check_duration
         collector._checks_total = mock_checks_total
         collector._errors_total = mock_errors_total
+        collector._bind_children()
 
         # Create a failed check without error code
         result = HealthCheckResult(
@@ -370,6 +375,33 @@ class TestMetricsCollectorWithPrometheus:
         # Error metric should not be recorded when error_code is None
         mock_errors_total.labels.assert_not_called()
 
+    def test_labels_bound_once(self, mock_prometheus: Mock) -> None:
+        """Test that record_check reuses label children bound at init."""
+        collector = MetricsCollector(
+            database="testdb", host="localhost", port=9090
+        )
+
+        mock_connection_status = MagicMock()
+        mock_errors_total = MagicMock()
+        collector._connection_status = mock_connection_status
+        collector._check_duration = MagicMock()
+        collector._checks_total = MagicMock()
+        collector._errors_total = mock_errors_total
+        collector._bind_children()
+
+        result = HealthCheckResult(
+            timestamp=datetime.utcnow(),
+            status="failure",
+            response_time_ms=10.0,
+            error_code="QUERY_TIMEOUT",
+        )
+        for _ in range(3):
+            collector.record_check(result)
+
+        assert mock_connection_status.labels.call_count == 1
+        assert mock_errors_total.labels.call_count == 1
+        assert mock_errors_total.labels.return_value.inc.call_count == 3
+
     def test_database_labels(self, mock_prometheus: Mock) -> None:
         """Test that database and host labels are correctly set."""
         collector = MetricsCollector(
@@ -383,6 +415,7 @@ class TestMetricsCollectorWithPrometheus:
         collector._check_duration = MagicMock()
         collector._checks_total = MagicMock()
         collector._errors_total = MagicMock()
+        collector._bind_children()
 
         result = HealthCheckResult(
             timestamp=datetime.utcnow(),
@@ -397,27 +430,204 @@ class TestMetricsCollectorWithPrometheus:
         mock_connection_status.labels.assert_called_with(**expected_labels)
 
 
+class TestMetricsCollectorRegistry:
+    """Tests for MetricsCollector with a caller-supplied registry."""
+
+    def test_metrics_registered_in_given_registry(self) -> None:
+        """Test that metrics go to the registry passed to the collector."""
+        prometheus_client = pytest.importorskip("prometheus_client")
+        registry = prometheus_client.CollectorRegistry()
+
+        collector = MetricsCollector(
+            database="testdb", host="localhost", port=9090, registry=registry
+        )
+        collector.record_check(
+            HealthCheckResult(
+                timestamp=datetime.utcnow(),
+                status="success",
+                response_time_ms=25.0,
+            )
+        )
+
+        labels = {"database": "testdb", "host": "localhost"}
+        assert registry.get_sample_value("db_up_connection_status", labels) == 1.0
+        assert (
+            registry.get_sample_value(
+                "db_up_checks_total", {**labels, "status": "success"}
+            )
+            == 1.0
+        )
+        assert (
+            registry.get_sample_value(
+                "db_up_checks_total", {**labels, "status": "failure"}
+            )
+            == 0.0
+        )
+
+    def test_record_check_skips_labels_lookup(self) -> None:
+        """Test that recording with real metrics never calls labels()."""
+        prometheus_client = pytest.importorskip("prometheus_client")
+        registry = prometheus_client.CollectorRegistry()
+
+        collector = MetricsCollector(
+            database="testdb", host="localhost", port=9090, registry=registry
+        )
+        result = HealthCheckResult(
+            timestamp=datetime.utcnow(),
+            status="failure",
+            response_time_ms=25.0,
+            error_code="QUERY_TIMEOUT",
+        )
+        collector.record_check(result)  # binds the QUERY_TIMEOUT error child
+
+        with patch.object(
+            prometheus_client.metrics.MetricWrapperBase,
+            "labels",
+            side_effect=AssertionError("labels() called"),
+        ):
+            for _ in range(3):
+                collector.record_check(result)
+
+        labels = {
+            "database": "testdb",
+            "host": "localhost",
+            "error_code": "QUERY_TIMEOUT",
+        }
+        assert registry.get_sample_value("db_up_errors_total", labels) == 4.0
+
+    def test_unknown_error_code_counted_as_other(self) -> None:
+        """Test that error codes outside the allowlist share one series."""
+        prometheus_client = pytest.importorskip("prometheus_client")
+        registry = prometheus_client.CollectorRegistry()
+
+        collector = MetricsCollector(
+            database="testdb", host="localhost", port=9090, registry=registry
+        )
+        for code in ("ERR-1234", "ERR-5678", "CONNECTION_ERROR"):
+            collector.record_check(
+                HealthCheckResult(
+                    timestamp=datetime.utcnow(),
+                    status="failure",
+                    response_time_ms=1.0,
+                    error_code=code,
+                )
+            )
+
+        labels = {"database": "testdb", "host": "localhost"}
+        assert (
+            registry.get_sample_value(
+                "db_up_errors_total", {**labels, "error_code": "OTHER"}
+            )
+            == 2.0
+        )
+        assert (
+            registry.get_sample_value(
+                "db_up_errors_total", {**labels, "error_code": "CONNECTION_ERROR"}
+            )
+            == 1.0
+        )
+        assert (
+            registry.get_sample_value(
+                "db_up_errors_total", {**labels, "error_code": "ERR-1234"}
+            )
+            is None
+        )
+
+    def test_series_exported_before_first_check(self) -> None:
+        """Test that pre-bound children export zero-valued series at startup."""
+        prometheus_client = pytest.importorskip("prometheus_client")
+        registry = prometheus_client.CollectorRegistry()
+
+        MetricsCollector(
+            database="testdb", host="localhost", port=9090, registry=registry
+        )
+
+        labels = {"database": "testdb", "host": "localhost"}
+        for status in ("success", "failure"):
+            value = registry.get_sample_value(
+                "db_up_checks_total", {**labels, "status": status}
+            )
+            assert value == 0.0
+        assert registry.get_sample_value("db_up_connection_status", labels) == 0.0
+        assert (
+            registry.get_sample_value("db_up_check_duration_seconds_count", labels)
+            == 0.0
+        )
+
+    def test_default_registries_do_not_collide(self) -> None:
+        """Test that collectors get their own registry by default."""
+        pytest.importorskip("prometheus_client")
+
+        first = MetricsCollector(database="testdb", host="localhost", port=9090)
+        second = MetricsCollector(database="testdb", host="localhost", port=9091)
+
+        assert first._registry is not second._registry
+        metric_names = {metric.name for metric in first._registry.collect()}
+        assert "db_up_connection_status" in metric_names
+        assert "python_info" in metric_names
+
+    def test_shutdown_releases_registry(self) -> None:
+        """Test that shutdown drops the registry and ignores later checks."""
+        pytest.importorskip("prometheus_client")
+
+        collector = MetricsCollector(database="testdb", host="localhost", port=9090)
+        result = HealthCheckResult(
+            timestamp=datetime.utcnow(),
+            status="failure",
+            response_time_ms=25.0,
+            error_code="QUERY_TIMEOUT",
+        )
+        collector.record_check(result)
+        registry_ref = weakref.ref(collector._registry)
+
+        collector.shutdown()
+        gc.collect()
+
+        assert collector._registry is None
+        assert registry_ref() is None
+        collector.record_check(result)  # Ignored, must not raise
+        collector.shutdown()  # Safe to call twice
+        with pytest.raises(RuntimeError, match="shut down"):
+            collector.start_server()
+
+    def test_separate_registries_do_not_collide(self) -> None:
+        """Test that collectors with their own registries can coexist."""
+        prometheus_client = pytest.importorskip("prometheus_client")
+
+        first = MetricsCollector(
+            database="db1",
+            host="localhost",
+            port=9090,
+            registry=prometheus_client.CollectorRegistry(),
+        )
+        second = MetricsCollector(
+            database="db2",
+            host="localhost",
+            port=9091,
+            registry=prometheus_client.CollectorRegistry(),
+        )
+
+        assert first._registry is not second._registry
+
+
 class TestMetricsCollectorWithoutPrometheus:
     """Tests for MetricsCollector when prometheus-client is not available."""
 
     @pytest.fixture
     def mock_prometheus(self) -> Mock:
-        """Mock prometheus_client module for creating collector."""
+        """Mock prometheus_client as not installed."""
         mock_counter = MagicMock()
         mock_gauge = MagicMock()
         mock_histogram = MagicMock()
         mock_start_http_server = MagicMock()
 
-        with patch.dict(
-            "sys.modules",
-            {
-                "prometheus_client": MagicMock(
-                    Counter=mock_counter,
-                    Gauge=mock_gauge,
-                    Histogram=mock_histogram,
-                    start_http_server=mock_start_http_server,
-                )
-            },
+        with patch.multiple(
+            "db_up.metrics",
+            _PROMETHEUS_AVAILABLE=False,
+            Counter=mock_counter,
+            Gauge=mock_gauge,
+            Histogram=mock_histogram,
+            start_http_server=mock_start_http_server,
         ):
             yield {
                 "Counter": mock_counter,
@@ -433,12 +643,12 @@ class TestMetricsCollectorWithoutPrometheus:
         collector = MetricsCollector(
             database="testdb", host="localhost", port=9090
         )
-        # Simulate prometheus not available
-        collector._prometheus_available = False
 
         assert collector._prometheus_available is False
         assert collector.database == "testdb"
         assert collector.host == "localhost"
+        mock_prometheus["Gauge"].assert_not_called()
+        mock_prometheus["Counter"].assert_not_called()
 
     def test_start_server_without_prometheus(
         self, mock_prometheus: Mock
@@ -447,7 +657,6 @@ class TestMetricsCollectorWithoutPrometheus:
         collector = MetricsCollector(
             database="testdb", host="localhost", port=9090
         )
-        collector._prometheus_available = False
 
         with pytest.raises(
             RuntimeError, match="prometheus-client not installed"
@@ -461,7 +670,6 @@ class TestMetricsCollectorWithoutPrometheus:
         collector = MetricsCollector(
             database="testdb", host="localhost", port=9090
         )
-        collector._prometheus_available = False
 
         # Should not raise error, just return early
         result = HealthCheckResult(
@@ -472,6 +680,7 @@ class TestMetricsCollectorWithoutPrometheus:
 
         # Should complete without error
         collector.record_check(result)
+        assert collector.record_check == collector._record_nothing
 
 
 class TestMetricsIntegration:
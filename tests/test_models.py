@@ -1,5 +1,8 @@
 """Tests for data models."""
 
+import dataclasses
+import sys
+
 import pytest
 from datetime import datetime
 from db_up.models import (
@@ -27,6 +30,16 @@ class TestHealthCheckResult:
         assert result.error_message is None
         assert "45ms" in str(result)
 
+    def test_response_time_seconds(self) -> None:
+        """Test that response time is also available in seconds."""
+        result = HealthCheckResult(
+            timestamp=datetime.utcnow(),
+            status="success",
+            response_time_ms=1500.0,
+        )
+
+        assert result.response_time_seconds == 1.5
+
     def test_failed_result(self) -> None:
         """Test creating a failed health check result."""
         result = HealthCheckResult(
@@ -194,6 +207,13 @@ class TestMonitorConfig:
             MonitorConfig(health_check_query="SELECT 1; DELETE FROM users")
         assert "cannot contain data modification statements" in str(exc.value)
 
+    def test_health_check_query_allows_keyword_substrings(self) -> None:
+        """Test that keywords inside identifiers are not rejected."""
+        config = MonitorConfig(
+            health_check_query="SELECT create_date, updated_at FROM status"
+        )
+        assert config.health_check_query.startswith("SELECT create_date")
+
 
 class TestLoggingConfig:
     """Tests for LoggingConfig model."""
@@ -282,3 +302,26 @@ class TestConfig:
 
         assert config.monitor.check_interval == 60
         assert config.logging.level == "INFO"
+
+    def test_config_is_frozen(self) -> None:
+        """Test that configuration objects cannot be mutated after loading."""
+        config = Config(database=DatabaseConfig(database="mydb", password="secret"))
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.monitor = MonitorConfig()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.logging.level = "DEBUG"
+
+    @pytest.mark.skipif(
+        sys.version_info < (3, 10), reason="dataclass slots need Python 3.10"
+    )
+    def test_models_have_no_instance_dict(self) -> None:
+        """Test that models use __slots__ instead of a per-instance __dict__."""
+        result = HealthCheckResult(
+            timestamp=datetime.utcnow(), status="success", response_time_ms=1.0
+        )
+        config = Config(database=DatabaseConfig(database="mydb", password="secret"))
+
+        assert not hasattr(result, "__dict__")
+        assert not hasattr(config, "__dict__")
+        assert not hasattr(config.logging, "__dict__")
@@ -1,8 +1,10 @@
 """Tests for retry logic."""
 
 import pytest
+import threading
 import time
-from unittest.mock import Mock
+from typing import Any, Dict, List, Optional, Tuple
+from unittest.mock import Mock, patch
 from db_up.retry import (
     calculate_backoff,
     retry_with_backoff,
@@ -11,6 +13,22 @@ from db_up.retry import (
 from db_up.models import MonitorConfig
 
 
+class PlainLogger:
+    """Duck-typed logger without isEnabledFor() or %-style arguments."""
+
+    def __init__(self) -> None:
+        self.records: List[Tuple[str, str]] = []
+
+    def info(self, msg: str, extra: Optional[Dict[str, Any]] = None) -> None:
+        self.records.append(("info", msg))
+
+    def warning(self, msg: str, extra: Optional[Dict[str, Any]] = None) -> None:
+        self.records.append(("warning", msg))
+
+    def error(self, msg: str, extra: Optional[Dict[str, Any]] = None) -> None:
+        self.records.append(("error", msg))
+
+
 class TestCalculateBackoff:
     """Tests for calculate_backoff function."""
 
@@ -52,6 +70,18 @@ class TestCalculateBackoff:
             delay = calculate_backoff(attempt, 1, "exponential", jitter=True)
             assert delay > 0
 
+    def test_jitter_bounds(self) -> None:
+        """Test that jitter scales the delay within ±20%."""
+        with patch("db_up.retry.random.random", return_value=0.0):
+            assert calculate_backoff(1, 10, "fixed", jitter=True) == 8.0
+        with patch("db_up.retry.random.random", return_value=0.5):
+            assert calculate_backoff(1, 10, "fixed", jitter=True) == 10.0
+
+    def test_jitter_minimum_delay(self) -> None:
+        """Test that jittered delays are floored at 0.1 seconds."""
+        with patch("db_up.retry.random.random", return_value=0.0):
+            assert calculate_backoff(1, 0, "fixed", jitter=True) == 0.1
+
     def test_invalid_strategy_raises_error(self) -> None:
         """Test that invalid strategy raises ValueError."""
         with pytest.raises(ValueError) as exc:
@@ -101,6 +131,35 @@ class TestRetryWithBackoff:
         assert "always fails" in str(exc.value)
         assert mock_func.call_count == 3  # Initial + 2 retries
 
+    def test_cancel_event_stops_retrying(self) -> None:
+        """Test that a set cancel event raises without waiting to retry."""
+        config = MonitorConfig(max_retries=3, retry_delay=60, retry_jitter=False)
+        mock_func = Mock(side_effect=Exception("fail"))
+        cancel_event = threading.Event()
+        cancel_event.set()
+
+        start = time.time()
+        with pytest.raises(Exception) as exc:
+            retry_with_backoff(mock_func, config, cancel_event=cancel_event)
+
+        assert "fail" in str(exc.value)
+        assert mock_func.call_count == 1
+        assert time.time() - start < 5
+
+    def test_cancel_event_wakes_waiting_retry(self) -> None:
+        """Test that setting the cancel event interrupts a backoff wait."""
+        config = MonitorConfig(max_retries=3, retry_delay=60, retry_jitter=False)
+        mock_func = Mock(side_effect=Exception("fail"))
+        cancel_event = threading.Event()
+        threading.Timer(0.1, cancel_event.set).start()
+
+        start = time.time()
+        with pytest.raises(Exception):
+            retry_with_backoff(mock_func, config, cancel_event=cancel_event)
+
+        assert mock_func.call_count == 1
+        assert time.time() - start < 5
+
     def test_zero_retries(self) -> None:
         """Test with zero retries (fail immediately)."""
         config = MonitorConfig(max_retries=0)
@@ -124,6 +183,47 @@ class TestRetryWithBackoff:
         assert mock_logger.warning.called
         assert mock_logger.info.called
 
+    def test_no_logging_when_level_disabled(self) -> None:
+        """Test that retry messages are not built for a disabled logger."""
+        config = MonitorConfig(max_retries=1, retry_delay=1, retry_jitter=False)
+        mock_func = Mock(side_effect=[Exception("fail"), "success"])
+        mock_logger = Mock()
+        mock_logger.isEnabledFor.return_value = False
+
+        with patch("db_up.retry.time.sleep"):
+            result = retry_with_backoff(mock_func, config, logger=mock_logger)
+
+        assert result == "success"
+        mock_logger.warning.assert_not_called()
+        mock_logger.info.assert_not_called()
+
+    def test_logging_with_plain_logger(self) -> None:
+        """Test that a logger without isEnabledFor() gets every message."""
+        config = MonitorConfig(max_retries=1, retry_delay=1, retry_jitter=False)
+        mock_func = Mock(side_effect=[Exception("fail"), "success"])
+        logger = PlainLogger()
+
+        with patch("db_up.retry.time.sleep"):
+            result = retry_with_backoff(mock_func, config, logger=logger)
+
+        # Logging must not turn a successful retry into a failure
+        assert result == "success"
+        assert mock_func.call_count == 2
+        assert logger.records == [
+            ("warning", "Operation failed, retrying in 1.0s (attempt 1/1)"),
+            ("info", "Operation succeeded after 1 retries"),
+        ]
+
+    def test_final_failure_with_plain_logger(self) -> None:
+        """Test that the original error is raised with a plain logger."""
+        config = MonitorConfig(max_retries=0)
+        logger = PlainLogger()
+
+        with pytest.raises(ValueError):
+            retry_with_backoff(Mock(side_effect=ValueError("fail")), config, logger)
+
+        assert logger.records == [("error", "Operation failed after 0 retries")]
+
     def test_logging_on_final_failure(self) -> None:
         """Test that final failure is logged."""
         config = MonitorConfig(max_retries=1, retry_delay=1, retry_jitter=False)
@@ -220,6 +320,36 @@ class TestRetryContext:
 
         assert mock_logger.error.called
 
+    def test_logging_with_plain_logger(self) -> None:
+        """Test that a logger without isEnabledFor() gets every message."""
+        config = MonitorConfig(max_retries=1, retry_delay=1, retry_jitter=False)
+        logger = PlainLogger()
+
+        with patch("db_up.retry.time.sleep"):
+            with RetryContext(config, logger=logger) as retry:
+                while retry.should_retry():
+                    retry.failure(Exception("fail"))
+
+        assert logger.records == [
+            ("warning", "Retrying in 1.0s (attempt 1/1)"),
+            ("error", "Operation failed after 1 retries"),
+        ]
+
+    def test_cancel_event_stops_retrying(self) -> None:
+        """Test that should_retry returns False once cancelled."""
+        config = MonitorConfig(max_retries=3, retry_delay=60, retry_jitter=False)
+        cancel_event = threading.Event()
+        attempt_count = 0
+
+        with RetryContext(config, cancel_event=cancel_event) as retry:
+            while retry.should_retry():
+                attempt_count += 1
+                cancel_event.set()
+                retry.failure(Exception("fail"))
+
+        assert attempt_count == 1
+        assert retry.last_exception is not None
+
     def test_context_manager_protocol(self) -> None:
         """Test that context manager protocol works correctly."""
         config = MonitorConfig(max_retries=1)
@@ -6,6 +6,8 @@ SECURITY: These tests are critical and must have 100% coverage.
 
 import pytest
 from db_up.security import (
+    has_host_marker,
+    has_sensitive_marker,
     sanitize_error,
     redact_connection_string,
     redact_config_for_logging,
@@ -102,6 +104,24 @@ class TestSanitizeError:
         assert "secret2" not in sanitized
         assert sanitized.count("***") >= 2
 
+    def test_connection_string_with_space_in_user(self) -> None:
+        """SECURITY: Test credentials after a space in the user are redacted."""
+        error = "postgresql://db user:secret123@host/db is unreachable"
+        sanitized = sanitize_error(error)
+
+        assert "secret123" not in sanitized
+        assert sanitized == "postgresql://*** is unreachable"
+
+    def test_mixed_sensitive_values(self) -> None:
+        """SECURITY: Test all sensitive formats are redacted in one message."""
+        error = (
+            "password=secret1 DB_PASSWORD='secret2' "
+            "DATABASE_URL=postgresql://u:secret3@h/db"
+        )
+        sanitized = sanitize_error(error)
+
+        assert sanitized == "password=*** DB_PASSWORD=***' DATABASE_URL=***"
+
     def test_case_insensitive(self) -> None:
         """SECURITY: Test redaction is case-insensitive."""
         error = "PASSWORD=secret123"
@@ -111,6 +131,46 @@ class TestSanitizeError:
         assert "***" in sanitized
 
 
+class TestHasSensitiveMarker:
+    """Tests for has_sensitive_marker function."""
+
+    def test_plain_errors_have_no_marker(self) -> None:
+        """Test that common non-credential errors skip sanitization."""
+        assert not has_sensitive_marker("connection timed out after 5s")
+        assert not has_sensitive_marker("could not translate host name")
+        assert sanitize_error("connection timed out") == "connection timed out"
+
+    def test_markers_match_case_insensitively(self) -> None:
+        """SECURITY: Test markers match every case the redaction regex does."""
+        assert has_sensitive_marker("DB_PASSWORD=x")
+        assert has_sensitive_marker("PostgreSQL://u:p@h/db")
+        assert has_sensitive_marker("Database_Url=x")
+        # U+017F (long s) casefolds to "s", and re.IGNORECASE matches it too
+        assert has_sensitive_marker("pa\u017f\u017fword=x")
+        assert "x" not in sanitize_error("pa\u017f\u017fword=x")
+
+
+class TestHasHostMarker:
+    """Tests for has_host_marker function."""
+
+    def test_plain_text_has_no_marker(self) -> None:
+        """Test that text without digits or localhost skips hostname redaction."""
+        assert not has_host_marker("could not translate host name")
+        assert sanitize_error("Health check passed", redact_hostnames=True) == (
+            "Health check passed"
+        )
+
+    def test_markers_cover_hostname_patterns(self) -> None:
+        """SECURITY: Test markers match every case the hostname regexes do."""
+        assert has_host_marker("connecting to 10.0.0.1")
+        assert has_host_marker("LOCALHOST refused")
+        # U+017F (long s) casefolds to "s", and re.IGNORECASE matches it too
+        assert has_host_marker("localho\u017ft refused")
+        assert sanitize_error("localho\u017ft refused", redact_hostnames=True) == (
+            "*** refused"
+        )
+
+
 class TestRedactConnectionString:
     """Tests for redact_connection_string function."""
 
@@ -160,6 +220,15 @@ class TestRedactConfigForLogging:
         assert config["password"] == "secret"  # Original unchanged
         assert redacted["password"] == "***"  # Copy redacted
 
+    def test_nested_original_not_modified(self) -> None:
+        """Test nested dicts and lists in the original are not modified."""
+        config = {"databases": [{"password": "secret"}], "ports": [5432]}
+        redacted = redact_config_for_logging(config)
+
+        assert config == {"databases": [{"password": "secret"}], "ports": [5432]}
+        assert redacted["databases"] is not config["databases"]
+        assert redacted["databases"][0]["password"] == "***"
+
     def test_nested_config(self) -> None:
         """SECURITY: Test nested password fields are redacted."""
         config = {
@@ -250,6 +319,10 @@ class TestValidateWebhookUrl:
         assert "localhost" in str(exc.value).lower()
         assert "SSRF" in str(exc.value)
 
+        # A trailing dot names the same host
+        with pytest.raises(ValueError):
+            validate_webhook_url("https://localhost./webhook")
+
     def test_loopback_ip_raises_error(self) -> None:
         """SECURITY: Test loopback IP is rejected."""
         with pytest.raises(ValueError) as exc:
@@ -286,6 +359,30 @@ class TestValidateWebhookUrl:
 
         assert "internal IP" in str(exc.value)
 
+    def test_internal_ipv6_and_special_addresses_raise_error(self) -> None:
+        """SECURITY: Test IPv6, IPv4-mapped and unspecified addresses."""
+        for host in ("[::1]", "[fe80::1]", "[fd00::1]", "[::ffff:10.0.0.1]", "0.0.0.0"):
+            with pytest.raises(ValueError) as exc:
+                validate_webhook_url(f"https://{host}/webhook")
+
+            assert "internal IP" in str(exc.value), host
+
+    def test_shorthand_ipv4_forms_raise_error(self) -> None:
+        """SECURITY: Test shorthand, integer and trailing-dot IPv4 hosts."""
+        hosts = ("127.1", "10.1", "127.0.0.1.", "2130706433", "0x7f000001", "0177.1")
+        for host in hosts:
+            with pytest.raises(ValueError) as exc:
+                validate_webhook_url(f"https://{host}/webhook")
+
+            assert "internal IP" in str(exc.value), host
+
+    def test_public_ip_is_valid(self) -> None:
+        """Test public IP addresses and names with numeric labels are valid."""
+        assert validate_webhook_url("https://93.184.216.34/webhook") is True
+        assert validate_webhook_url("https://[2606:4700::1111]/webhook") is True
+        assert validate_webhook_url("https://10.example.com/webhook") is True
+        assert validate_webhook_url("https://134744072/webhook") is True  # 8.8.8.8
+
     def test_invalid_url_raises_error(self) -> None:
         """Test invalid URL raises error."""
         with pytest.raises(ValueError) as exc:
@@ -349,6 +446,18 @@ class TestValidateSqlQuery:
 
         assert "UPDATE" in str(exc.value)
 
+    def test_keyword_inside_identifier_is_valid(self) -> None:
+        """Test keywords that are part of identifiers are not rejected."""
+        assert validate_sql_query("SELECT create_date FROM status") is True
+        assert validate_sql_query("SELECT 1 AS executed, dropped_at FROM t") is True
+
+    def test_execute_raises_error(self) -> None:
+        """SECURITY: Test EXECUTE is reported by its full keyword."""
+        with pytest.raises(ValueError) as exc:
+            validate_sql_query("SELECT 1; EXECUTE stmt")
+
+        assert "'EXECUTE'" in str(exc.value)
+
     def test_multiple_statements_raises_error(self) -> None:
         """SECURITY: Test multiple statements are rejected."""
         with pytest.raises(ValueError) as exc: